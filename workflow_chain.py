@@ -2,7 +2,16 @@
 """Workflow Chain System - Visual pipeline orchestrator for multi-project workflows."""
 
 import asyncio
+import heapq
+import io
+import json
 import subprocess
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
 
@@ -16,11 +25,14 @@ from textual.screen import Screen, ModalScreen
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.timer import Timer
+from textual.message import Message
+from textual import work
+from textual.worker import get_current_worker
 
 from config_panel import get_textual_theme, get_footer_position, get_show_header
 from workflow_models import (
     WorkflowChain, WorkflowNode, NodeStatus,
-    STATUS_ICONS, STATUS_COLORS
+    STATUS_ICONS, STATUS_COLORS, new_id
 )
 from workflow_storage import (
     load_workflows, save_workflow, delete_workflow, get_workflow,
@@ -36,6 +48,46 @@ DEFAULT_ROOTS = [
 ]
 
 
+# Largest workflow document accepted by URL import
+MAX_IMPORT_BYTES = 10 * 1024 * 1024
+
+
+class _CappedReader(io.RawIOBase):
+    """Raw binary stream over a response that fails once it passes limit bytes."""
+
+    def __init__(self, stream, limit: int):
+        self._stream = stream
+        self._left = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = self._stream.readinto(buffer)
+        self._left -= count
+        if self._left < 0:
+            raise ValueError("response too large")
+        return count
+
+
+# Config-derived settings are read once per process, as each getter loads the
+# config file. The config is edited by config_panel, not by this app, so
+# changes apply the next time the app starts.
+@lru_cache(maxsize=1)
+def _show_header() -> bool:
+    return get_show_header()
+
+
+@lru_cache(maxsize=1)
+def _footer_position() -> str:
+    return get_footer_position()
+
+
+@lru_cache(maxsize=1)
+def _textual_theme() -> str:
+    return get_textual_theme()
+
+
 def get_project_directories(roots: list[Path] = None) -> list[Path]:
     """Get all project directories from root dirs."""
     if roots is None:
@@ -69,17 +121,42 @@ def fuzzy_match(query: str, text: str) -> bool:
 # Custom Widgets
 # ---------------------------------------------------------------------------
 
+class MigrationProgress(Message):
+    """Posted by the migration worker before each dependency chain."""
+
+    def __init__(self, current: int, total: int, name: str):
+        super().__init__()
+        self.current = current
+        self.total = total
+        self.name = name
+
+
 class WorkflowItem(ListItem):
     """List item for workflow display."""
 
     def __init__(self, workflow: WorkflowChain):
         super().__init__()
         self.workflow = workflow
+        self.info_text = self._info_text()
 
-    def compose(self) -> ComposeResult:
+    def _info_text(self) -> str:
+        wf = self.workflow
+        return f"{len(wf.nodes)} nodes | Created: {wf.created_at[:10]} | Updated: {wf.updated_at[:10]}"
+
+    def _label_text(self) -> str:
         completed, total = self.workflow.progress
         status = "✓" if self.workflow.is_complete() else f"{completed}/{total}"
-        yield Static(f"  {self.workflow.name} [{status}]")
+        return f"  {self.workflow.name} [{status}]"
+
+    def compose(self) -> ComposeResult:
+        yield Static(self._label_text())
+
+    def set_workflow(self, workflow: WorkflowChain):
+        """Point this item at a (reloaded) workflow and update its label in place."""
+        self.workflow = workflow
+        self.info_text = self._info_text()
+        for label in self.query(Static):
+            label.update(self._label_text())
 
 
 class NodeItem(ListItem):
@@ -408,9 +485,11 @@ class FzfDirectoryDialog(ModalScreen):
         ]
 
         fzf_list = self.query_one("#fzf-list", ListView)
-        fzf_list.clear()
-        for directory in self.filtered_directories:
-            fzf_list.append(FavoriteItem(str(directory), show_parent=True))
+        items = [FavoriteItem(str(d), show_parent=True) for d in self.filtered_directories]
+        # Mount all items in one call so the list is laid out once, not per item
+        with self.app.batch_update():
+            fzf_list.clear()
+            fzf_list.extend(items)
 
         # Update count
         shown = len(self.filtered_directories)
@@ -523,11 +602,24 @@ class WorkflowEditorScreen(Screen):
         self.refresh_nodes()
         self.query_one("#name-input").focus()
 
+    def load_workflow(self, workflow: WorkflowChain):
+        """Point a cached editor at a fresh copy of its workflow."""
+        self.workflow = workflow
+        self.selected_node = None
+        self.field_idx = 0
+        self.query_one("#name-input", Input).value = workflow.name
+        self.query_one("#context-input", TextArea).text = workflow.global_context
+        self.query_one("#prompt-input", Input).value = ""
+        self.title = f"Edit: {workflow.name or 'New Workflow'}"
+        self.refresh_nodes()
+        self.query_one("#name-input").focus()
+
     def refresh_nodes(self):
         node_list = self.query_one("#node-list", ListView)
-        node_list.clear()
-        for i, node in enumerate(self.workflow.nodes):
-            node_list.append(NodeItem(node, i + 1))
+        items = [NodeItem(node, i + 1) for i, node in enumerate(self.workflow.nodes)]
+        with self.app.batch_update():
+            node_list.clear()
+            node_list.extend(items)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted):
         if event.item and isinstance(event.item, NodeItem):
@@ -633,9 +725,10 @@ class ExecutionScreen(Screen):
         self.workflow = workflow
         self.orchestrator: WorkflowOrchestrator = None
         self.refresh_timer: Timer = None
+        self._executor: TmuxExecutor = None
 
     def compose(self) -> ComposeResult:
-        if get_show_header():
+        if _show_header():
             yield Header(show_clock=False)
 
         with Vertical(id="exec-header"):
@@ -651,6 +744,8 @@ class ExecutionScreen(Screen):
 
     def on_mount(self):
         self.title = "Workflow Execution"
+        # One executor for the screen's lifetime (uses dedicated claude-code session)
+        self._executor = TmuxExecutor()
         self.refresh_display()
 
         # Start orchestrator (no callback - timer handles UI refresh)
@@ -691,25 +786,23 @@ class ExecutionScreen(Screen):
 
         # Update status
         status_label = self.query_one("#exec-status", Label)
-        running = len(self.workflow.get_running_nodes())
-        completed, total = self.workflow.progress
+        snap = self.workflow.snapshot()
 
-        if self.workflow.is_complete():
-            if self.workflow.has_failed():
+        if snap.is_complete:
+            if snap.has_failed:
                 status_label.update("Status: Completed with errors")
             else:
                 status_label.update("Status: Completed successfully")
         elif self.orchestrator and self.orchestrator.is_paused:
             status_label.update("Status: Paused")
         else:
-            status_label.update(f"Status: Running ({running} active, {completed}/{total} done)")
+            status_label.update(f"Status: Running ({snap.running} active, {snap.completed}/{snap.total} done)")
 
         # Update progress bar
         progress = self.query_one("#progress", ProgressBar)
-        progress.update(progress=completed)
+        progress.update(progress=snap.completed)
 
-        # Build node displays as text (uses dedicated claude-code session)
-        executor = TmuxExecutor()
+        # Build node displays as text
         for i, node in enumerate(self.workflow.nodes):
             icon = STATUS_ICONS.get(node.status, "?")
             color = STATUS_COLORS.get(node.status, "white")
@@ -725,7 +818,7 @@ class ExecutionScreen(Screen):
 
             if node.status == NodeStatus.RUNNING and node.tmux_pane:
                 # Show live output tail
-                output = executor.capture_pane_output(node.tmux_pane, 5)
+                output = self._executor.capture_pane_output(node.tmux_pane, 5)
                 if output.strip():
                     output_lines = output.strip().split("\n")[-3:]
                     lines.append("   " + "\n   ".join(output_lines))
@@ -752,16 +845,25 @@ class ExecutionScreen(Screen):
 
     def action_focus_running(self):
         """Jump to tmux window of running node in claude-code session."""
-        executor = TmuxExecutor()
         for node in self.workflow.get_running_nodes():
             if node.tmux_pane:
                 window_name = f"wf-{node.id}"
-                executor.focus_window(window_name)
+                self._executor.focus_window(window_name)
                 break
 
-    def action_back(self):
+    def _close_executor(self):
+        """Stop refreshing and detach the screen's tmux control client."""
         if self.refresh_timer:
             self.refresh_timer.stop()
+        if self._executor:
+            self._executor.close()
+            self._executor = None
+
+    def on_unmount(self):
+        self._close_executor()
+
+    def action_back(self):
+        self._close_executor()
         self.app.pop_screen()
 
 
@@ -818,7 +920,7 @@ class LogViewerScreen(Screen):
         self.selected_node_idx = 0
 
     def compose(self) -> ComposeResult:
-        if get_show_header():
+        if _show_header():
             yield Header(show_clock=False)
 
         yield Label(f"Logs: {self.workflow.name}", id="log-header")
@@ -844,6 +946,24 @@ class LogViewerScreen(Screen):
         # Auto-refresh every 2 seconds
         self.refresh_timer = self.set_interval(2, self.refresh_all)
 
+    def on_screen_suspend(self):
+        # Cached instances stay installed; don't poll while hidden
+        if self.refresh_timer:
+            self.refresh_timer.pause()
+
+    def on_screen_resume(self):
+        if self.refresh_timer:
+            self.refresh_timer.resume()
+
+    def load_workflow(self, workflow: WorkflowChain):
+        """Point a cached log viewer at a fresh copy of its workflow."""
+        self.workflow = workflow
+        self.selected_node_idx = 0
+        self.title = f"Logs - {workflow.name}"
+        self.query_one("#log-header", Label).update(f"Logs: {workflow.name}")
+        self.refresh_all()
+        self.update_node_selector()
+
     def get_nodes_with_panes(self) -> list:
         """Get nodes that have tmux panes assigned."""
         return [n for n in self.workflow.nodes if n.tmux_pane]
@@ -968,11 +1088,13 @@ class LogViewerScreen(Screen):
         """Switch to the tmux pane in terminal."""
         node = self.get_current_node()
         if node and node.tmux_pane:
+            # Fire-and-forget: output and exit status are not needed, so don't wait
             try:
-                subprocess.run(
+                subprocess.Popen(
                     ["tmux", "select-pane", "-t", node.tmux_pane],
-                    capture_output=True,
-                    timeout=2
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                 )
             except Exception:
                 pass
@@ -1028,13 +1150,27 @@ class WorkflowListScreen(Screen):
         ("q", "quit", "Quit"),
     ]
 
+    # Seconds of highlight quiescence before the preview is re-rendered
+    HIGHLIGHT_DEBOUNCE = 0.1
+    # Above this many workflows only the first screenful (+ buffer) is sorted
+    # up front; the rest is sorted when the highlight nears the end of the list
+    LAZY_SORT_THRESHOLD = 200
+    LAZY_SORT_BUFFER = 50
+
     def __init__(self):
         super().__init__()
         self.workflows: dict[str, WorkflowChain] = {}
+        self._sorted_wfs: list[WorkflowChain] = []  # Most recently updated first
+        self._sort_pending = False                  # _sorted_wfs holds only the newest ones
+        self._items: list[WorkflowItem] = []        # Mounted items, in list order
+        self._item_by_id: dict[str, WorkflowItem] = {}
         self.favorites = load_favorites()
+        self._pending_highlight: WorkflowItem | None = None
+        self._highlight_timer: Timer | None = None
+        self._preview_key: tuple[str, str] | None = None  # (id, updated_at) shown in preview
 
     def compose(self) -> ComposeResult:
-        if get_show_header():
+        if _show_header():
             yield Header(show_clock=False)
 
         with Horizontal(id="wf-main"):
@@ -1059,15 +1195,59 @@ class WorkflowListScreen(Screen):
         self.refresh_workflows()
 
     def refresh_workflows(self):
-        self.workflows = load_workflows()
+        """Reload workflows in the background; the current list stays visible meanwhile."""
+        if not self._items:
+            self.query_one("#info-bar", Static).update("Loading workflows…")
+        self._load_workflows()
+
+    @work(thread=True, exclusive=True, group="load_workflows")
+    def _load_workflows(self) -> None:
+        """Read workflow storage off the UI thread."""
+        workflows = load_workflows()
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_workflows, workflows)
+
+    def _apply_workflows(self, workflows: dict[str, WorkflowChain]):
+        """Show freshly loaded workflows in the list (UI thread)."""
+        self.workflows = workflows
         wf_list = self.query_one("#workflow-list", ListView)
-        wf_list.clear()
-
-        for wf in sorted(self.workflows.values(), key=lambda w: w.updated_at, reverse=True):
-            wf_list.append(WorkflowItem(wf))
+        selected = self.get_selected_workflow()
+
+        by_updated = attrgetter("updated_at")
+        self._sort_pending = False
+        if len(self.workflows) > self.LAZY_SORT_THRESHOLD:
+            rows = wf_list.size.height or self.LAZY_SORT_BUFFER
+            self._sorted_wfs = heapq.nlargest(rows + self.LAZY_SORT_BUFFER, self.workflows.values(), key=by_updated)
+            self._sort_pending = len(self._sorted_wfs) < len(self.workflows)
+            # By id: a reloaded chain is a new object and dataclass == compares every field
+            if (selected and self._sort_pending
+                    and selected.id not in {wf.id for wf in self._sorted_wfs}):
+                self._sort_pending = False
+        if not self._sort_pending:
+            self._sorted_wfs = sorted(self.workflows.values(), key=by_updated, reverse=True)
+
+        # Reuse mounted items in place; only mount/remove the difference in count
+        kept = min(len(self._items), len(self._sorted_wfs))
+        with self.app.batch_update():
+            for item, wf in zip(self._items, self._sorted_wfs):
+                item.set_workflow(wf)
+            if len(self._sorted_wfs) > kept:
+                new_items = [WorkflowItem(wf) for wf in self._sorted_wfs[kept:]]
+                wf_list.extend(new_items)
+                self._items.extend(new_items)
+            elif len(self._items) > kept:
+                wf_list.remove_children(self._items[kept:])
+                del self._items[kept:]
+        self._item_by_id = {item.workflow.id: item for item in self._items}
+
+        # Keep the same workflow highlighted even if its position changed
+        if selected and selected.id in self._item_by_id:
+            wf_list.index = self._items.index(self._item_by_id[selected.id])
+        elif wf_list.index is not None:
+            wf_list.index = min(wf_list.index, len(self._items) - 1) if self._items else None
 
         # Auto-select first workflow after refresh completes
-        if wf_list.children:
+        if self._items:
             self.call_later(self._select_first_workflow)
         
         if not self.workflows:
@@ -1075,23 +1255,48 @@ class WorkflowListScreen(Screen):
             info.update("No workflows. Press 'n' to create or 'm' to migrate from dependencies.")
 
     def _select_first_workflow(self):
-        """Update preview with first workflow without manipulating ListView."""
-        if self.workflows:
-            # Get first workflow (most recently updated)
-            first_wf = sorted(self.workflows.values(), key=lambda w: w.updated_at, reverse=True)[0]
-            diagram = self.query_one("#chain-preview", ChainDiagram)
-            diagram.update_chain(first_wf)
-            info = self.query_one("#info-bar", Static)
-            info.update(f"{len(first_wf.nodes)} nodes | Created: {first_wf.created_at[:10]} | Updated: {first_wf.updated_at[:10]}")
+        """Update preview with highlighted (or first) workflow without manipulating ListView."""
+        if self._items:
+            # Highlighted workflow, else first (most recently updated)
+            highlighted = self.query_one("#workflow-list", ListView).highlighted_child
+            item = highlighted if isinstance(highlighted, WorkflowItem) else self._items[0]
+            self._show_preview(item)
 
     def on_list_view_highlighted(self, event: ListView.Highlighted):
+        # Debounce preview updates - only render after user stops navigating
         if event.item and isinstance(event.item, WorkflowItem):
-            diagram = self.query_one("#chain-preview", ChainDiagram)
-            diagram.update_chain(event.item.workflow)
-
-            info = self.query_one("#info-bar", Static)
-            wf = event.item.workflow
-            info.update(f"{len(wf.nodes)} nodes | Created: {wf.created_at[:10]} | Updated: {wf.updated_at[:10]}")
+            self._pending_highlight = event.item
+            if self._highlight_timer:
+                self._highlight_timer.stop()
+            self._highlight_timer = self.set_timer(self.HIGHLIGHT_DEBOUNCE, self._apply_highlight)
+            if self._sort_pending and event.list_view.index >= len(self._items) - self.LAZY_SORT_BUFFER:
+                self._load_remaining_workflows()
+
+    def _load_remaining_workflows(self):
+        """Sort and append the workflows left out of the initial partial sort."""
+        self._sort_pending = False
+        full = sorted(self.workflows.values(), key=attrgetter("updated_at"), reverse=True)
+        new_items = [WorkflowItem(wf) for wf in full[len(self._sorted_wfs):]]
+        self._sorted_wfs = full
+        self.query_one("#workflow-list", ListView).extend(new_items)
+        self._items.extend(new_items)
+        self._item_by_id.update((item.workflow.id, item) for item in new_items)
+
+    def _apply_highlight(self):
+        """Render preview and info bar for the last highlighted workflow."""
+        self._highlight_timer = None
+        item = self._pending_highlight
+        if item:
+            self._show_preview(item)
+
+    def _show_preview(self, item: WorkflowItem):
+        """Show a workflow in the preview, skipping the redraw if it is already shown."""
+        wf = item.workflow
+        key = (wf.id, wf.updated_at)
+        if key != self._preview_key:
+            self._preview_key = key
+            self.query_one("#chain-preview", ChainDiagram).update_chain(wf)
+        self.query_one("#info-bar", Static).update(item.info_text)
 
     def get_selected_workflow(self) -> WorkflowChain | None:
         wf_list = self.query_one("#workflow-list", ListView)
@@ -1105,7 +1310,7 @@ class WorkflowListScreen(Screen):
                 workflow = create_workflow(name)
                 self.refresh_workflows()
                 # Open editor
-                self.app.push_screen(WorkflowEditorScreen(workflow))
+                self.app.push_workflow_screen(WorkflowEditorScreen, workflow)
 
         self.app.push_screen(NewWorkflowDialog(), handle_result)
 
@@ -1115,25 +1320,59 @@ class WorkflowListScreen(Screen):
             if url:
                 info = self.query_one("#info-bar", Static)
                 info.update(f"Importing from {url}...")
-                try:
-                    import urllib.request
-                    import json as json_mod
-                    with urllib.request.urlopen(url, timeout=10) as response:
-                        data = json_mod.loads(response.read().decode())
-                    workflow = WorkflowChain.from_dict(data)
-                    workflow.id = str(__import__("uuid").uuid4())[:8]
-                    save_workflow(workflow)
-                    self.refresh_workflows()
-                    info.update(f"Imported: {workflow.name}")
-                except Exception as e:
-                    info.update(f"Import failed: {e}")
+                self._fetch_workflow(url)
 
         self.app.push_screen(ImportFromUrlDialog(), handle_result)
 
+    @staticmethod
+    def _check_import_url(url: str) -> None:
+        """Reject non-HTTP URLs and oversized or non-JSON responses before downloading."""
+        if urllib.parse.urlsplit(url).scheme not in ("http", "https"):
+            raise ValueError("URL must start with http:// or https://")
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method="HEAD"), timeout=5) as response:
+                headers = response.headers
+        except urllib.error.HTTPError as e:
+            if e.code in (405, 501):  # HEAD not supported; rely on the capped read
+                return
+            raise
+        length = headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > MAX_IMPORT_BYTES:
+            raise ValueError(f"response too large ({int(length) // 1024} KB)")
+        content_type = headers.get_content_type()
+        if "json" not in content_type and content_type != "text/plain":
+            raise ValueError(f"unexpected content type {content_type}")
+
+    @work(thread=True, exclusive=True, group="import")
+    def _fetch_workflow(self, url: str) -> None:
+        """Download and save a workflow in a background thread."""
+        try:
+            self._check_import_url(url)
+            with urllib.request.urlopen(url, timeout=10) as response:
+                charset = response.headers.get_content_charset() or "utf-8"
+                # Decode and parse as the body streams in, stopping past the cap
+                reader = io.BufferedReader(_CappedReader(response, MAX_IMPORT_BYTES))
+                data = json.load(io.TextIOWrapper(reader, encoding=charset))
+            workflow = WorkflowChain.from_dict(data)
+            workflow.id = new_id()
+            save_workflow(workflow)
+            self.app.call_from_thread(self._import_complete, workflow)
+        except Exception as e:
+            self.app.call_from_thread(self._import_error, str(e))
+
+    def _import_complete(self, workflow: WorkflowChain):
+        """Handle successful import (UI thread)."""
+        self.refresh_workflows()
+        self.query_one("#info-bar", Static).update(f"Imported: {workflow.name}")
+
+    def _import_error(self, error: str):
+        """Handle failed import (UI thread)."""
+        self.query_one("#info-bar", Static).update(f"Import failed: {error}")
+
     def action_edit_workflow(self):
         workflow = self.get_selected_workflow()
         if workflow:
-            self.app.push_screen(WorkflowEditorScreen(workflow))
+            self.app.push_workflow_screen(WorkflowEditorScreen, workflow)
 
     def action_run_workflow(self):
         workflow = self.get_selected_workflow()
@@ -1176,13 +1415,30 @@ class WorkflowListScreen(Screen):
 
     def action_migrate(self):
         """Migrate existing dependency chains to workflows."""
-        count = migrate_from_dependencies()
+        self.query_one("#info-bar", Static).update("Migrating dependency chains…")
+        self._migrate()
+
+    @work(thread=True, exclusive=True, group="migrate")
+    def _migrate(self):
+        """Run the migration off the UI thread, reporting progress."""
+        def progress(current, total, name):
+            self.post_message(MigrationProgress(current, total, name))
+
+        count = migrate_from_dependencies(progress)
+        self.app.call_from_thread(self._migrate_complete, count)
+
+    def on_migration_progress(self, event: "MigrationProgress"):
+        self.query_one("#info-bar", Static).update(
+            f"Migrating {event.current}/{event.total}: {event.name}…"
+        )
+
+    def _migrate_complete(self, count):
+        # The reload re-renders the info bar, so report the result as a toast
         self.refresh_workflows()
-        info = self.query_one("#info-bar", Static)
         if count:
-            info.update(f"Migrated {count} dependency chains to workflows")
+            self.notify(f"Migrated {count} dependency chains to workflows")
         else:
-            info.update("No dependency chains to migrate")
+            self.notify("No dependency chains to migrate")
 
     def action_toggle_focus(self):
         wf_list = self.query_one("#workflow-list", ListView)
@@ -1192,7 +1448,7 @@ class WorkflowListScreen(Screen):
         """View logs for the selected workflow."""
         workflow = self.get_selected_workflow()
         if workflow:
-            self.app.push_screen(LogViewerScreen(workflow))
+            self.app.push_workflow_screen(LogViewerScreen, workflow)
         else:
             info = self.query_one("#info-bar", Static)
             info.update("No workflow selected. Select one to view logs.")
@@ -1208,25 +1464,51 @@ class WorkflowListScreen(Screen):
 class WorkflowChainApp(App):
     """Workflow Chain System - Visual pipeline orchestrator."""
 
+    # $footer-dock comes from get_css_variables, so no config is read at import
+    CSS = """
+    Screen {
+        background: $background;
+    }
+    * {
+        scrollbar-size: 1 1;
+    }
+    Footer {
+        dock: $footer-dock;
+    }
+    """
+
+    # Per-workflow editor/log screens kept installed for quick revisits
+    SCREEN_CACHE_SIZE = 4
+
     def __init__(self):
-        footer_pos = get_footer_position()
-        self.CSS = f"""
-        Screen {{
-            background: $background;
-        }}
-        * {{
-            scrollbar-size: 1 1;
-        }}
-        Footer {{
-            dock: {footer_pos};
-        }}
-        """
         super().__init__()
-        self.theme = get_textual_theme()
+        self.theme = _textual_theme()
+        self._screen_cache: OrderedDict[str, Screen] = OrderedDict()
+
+    def get_css_variables(self) -> dict[str, str]:
+        return {**super().get_css_variables(), "footer-dock": _footer_position()}
 
     def on_mount(self):
         self.push_screen(WorkflowListScreen())
 
+    def push_workflow_screen(self, screen_cls, workflow: WorkflowChain):
+        """Push an editor/log screen for workflow, reusing a cached instance."""
+        name = f"{screen_cls.__name__}:{workflow.id}"
+        screen = self._screen_cache.get(name)
+        if screen is None:
+            screen = screen_cls(workflow)
+            self.install_screen(screen, name)
+            self._screen_cache[name] = screen
+            while len(self._screen_cache) > self.SCREEN_CACHE_SIZE:
+                old_name, old_screen = self._screen_cache.popitem(last=False)
+                self.uninstall_screen(old_name)
+                if old_screen.is_mounted:
+                    old_screen.remove()
+        else:
+            self._screen_cache.move_to_end(name)
+            screen.load_workflow(workflow)
+        self.push_screen(screen)
+
 
 def main():
     app = WorkflowChainApp()
@@ -3,25 +3,120 @@
 import subprocess
 import asyncio
 import atexit
+import ctypes
+import itertools
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
-import signal
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Callable
 
 from workflow_models import WorkflowChain, WorkflowNode, NodeStatus
-from workflow_storage import save_workflow, set_active_workflow, add_execution_history
+from workflow_storage import (
+    save_workflow, set_active_workflow, add_execution_history,
+    json_dumps_bytes, json_loads,
+)
 
+# Optional: pyahocorasick for single-pass multi-marker matching
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+# pane_current_command values that mean the pane is back at a shell prompt
+SHELL_SET = frozenset({"zsh", "bash", "fish", "-zsh", "-bash"})
 
 # Workflow logs directory
 WORKFLOW_LOGS_DIR = Path.home() / ".claude" / "workflow_logs"
 
 
+def _marker_automaton(markers: list[str]):
+    """Aho-Corasick automaton over markers, or None without pyahocorasick."""
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for marker in markers:
+        automaton.add_word(marker, marker)
+    automaton.make_automaton()
+    return automaton
+
+
+def _write_bytes(path: Path, data: bytes, mode: int = 0o644, exact_mode: bool = False):
+    """Write a small file with raw os.open/os.write (no buffered IO objects).
+
+    With exact_mode the file gets mode as given instead of mode less the umask.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        if exact_mode:
+            os.fchmod(fd, mode)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _replace_bytes(path: Path, data: bytes):
+    """Write data to path atomically (temp file in the same dir, then os.replace).
+
+    An existing file keeps its permission bits, as it would when rewritten in place.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    try:
+        if mode is None:
+            _write_bytes(tmp, data)
+        else:
+            _write_bytes(tmp, data, mode, exact_mode=True)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class _BufferHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes on WorkflowLogger.flush() marker records."""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        done = getattr(record, "flush_event", None)
+        if done is None:
+            return super().handle(record)
+        self.flush()
+        done.set()
+        return False
+
+
 class WorkflowLogger:
-    """Per-workflow file logger."""
+    """Per-workflow file logger.
+
+    Logging calls only enqueue the record; a background QueueListener owns
+    the file and buffers records in memory, writing them in batches: on ERROR,
+    when the buffer fills, on flush() (node completions and every few seconds
+    of the orchestrator poll) and on close/exit.
+    """
+
+    BUFFER_CAPACITY = 512
+    # Longest flush() waits for the listener to reach its marker
+    FLUSH_TIMEOUT = 1.0
+
+    # Open logger per workflow id; a new one for the same id closes the old
+    _open: dict[str, "WorkflowLogger"] = {}
 
     def __init__(self, workflow_id: str, workflow_name: str = ""):
         self.workflow_id = workflow_id
@@ -38,7 +133,13 @@ class WorkflowLogger:
         """Set up file logger for this workflow."""
         self.logger = logging.getLogger(f"workflow.{self.workflow_id}")
         self.logger.setLevel(logging.DEBUG)
-        self.logger.handlers.clear()  # Remove any existing handlers
+        previous = self._open.get(self.workflow_id)
+        if previous:
+            previous.close()
+        # Remove any other handlers, writing out what they still buffer
+        for old in list(self.logger.handlers):
+            self.logger.removeHandler(old)
+            self._stop_handler(old)
 
         # File handler with detailed format
         handler = logging.FileHandler(self.log_file, mode='a')
@@ -48,19 +149,70 @@ class WorkflowLogger:
             datefmt='%H:%M:%S'
         )
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        self._buffer = _BufferHandler(
+            capacity=self.BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=handler,
+            flushOnClose=True,
+        )
+        self._queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self._queue_handler.listener = logging.handlers.QueueListener(
+            self._queue_handler.queue, self._buffer
+        )
+        self._queue_handler.listener.start()
+        self.logger.addHandler(self._queue_handler)
+        self._open[self.workflow_id] = self
+        atexit.register(self.close)
+
+    @staticmethod
+    def _stop_handler(handler: logging.Handler):
+        """Drain a queue handler's listener and close the file behind it."""
+        listener = getattr(handler, "listener", None)
+        if listener:
+            if listener._thread:
+                listener.stop()
+            for target in listener.handlers:
+                target.close()
+                if isinstance(target, logging.handlers.MemoryHandler) and target.target:
+                    target.target.close()
+        handler.close()
+
+    def flush(self):
+        """Write queued and buffered records to the log file."""
+        if not self._queue_handler.listener._thread:
+            self._buffer.flush()
+            return
+        # The listener flushes the buffer when it reaches the marker, after
+        # every record queued before it
+        done = threading.Event()
+        self._queue_handler.queue.put_nowait(logging.makeLogRecord({"flush_event": done}))
+        done.wait(self.FLUSH_TIMEOUT)
 
-    def info(self, msg: str):
-        self.logger.info(msg)
+    def close(self):
+        """Flush and release the log file."""
+        atexit.unregister(self.close)
+        if self._open.get(self.workflow_id) is self:
+            del self._open[self.workflow_id]
+        self.logger.removeHandler(self._queue_handler)
+        self._stop_handler(self._queue_handler)
+
+    # Extra args are %-formatted only if the record is kept, as with logging
 
-    def debug(self, msg: str):
-        self.logger.debug(msg)
+    def info(self, msg: str, *args):
+        self.logger.info(msg, *args)
 
-    def warning(self, msg: str):
-        self.logger.warning(msg)
+    def debug(self, msg: str, *args):
+        self.logger.debug(msg, *args)
 
-    def error(self, msg: str):
-        self.logger.error(msg)
+    def isdebug(self) -> bool:
+        """Whether debug records are kept; guard costly debug formatting with it."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def warning(self, msg: str, *args):
+        self.logger.warning(msg, *args)
+
+    def error(self, msg: str, *args):
+        self.logger.error(msg, *args)
 
     def node_event(self, node_id: str, event: str, details: str = ""):
         """Log a node-specific event."""
@@ -71,6 +223,7 @@ class WorkflowLogger:
 
     def clear(self):
         """Clear the log file."""
+        self.flush()
         if self.log_file.exists():
             self.log_file.write_text("")
 
@@ -86,10 +239,20 @@ class WorkflowLogger:
         if not log_file.exists():
             return "No logs yet."
         try:
-            lines = log_file.read_text().splitlines()
-            if tail_lines and len(lines) > tail_lines:
-                lines = lines[-tail_lines:]
-            return "\n".join(lines)
+            if not tail_lines:
+                return "\n".join(log_file.read_text().splitlines())
+            # Read backwards in chunks until enough lines are buffered, so the
+            # cost doesn't grow with the size of the log
+            with open(log_file, "rb") as f:
+                pos = f.seek(0, os.SEEK_END)
+                data = b""
+                while pos > 0 and data.count(b"\n") <= tail_lines:
+                    step = min(8192, pos)
+                    pos -= step
+                    f.seek(pos)
+                    data = f.read(step) + data
+            lines = data.decode("utf-8", "replace").splitlines()
+            return "\n".join(lines[-tail_lines:])
         except IOError:
             return "Error reading log file."
 
@@ -99,7 +262,7 @@ class WorkflowLogger:
         error_file = WORKFLOW_LOGS_DIR / f"{workflow_id}_{node_id}.error"
         try:
             WORKFLOW_LOGS_DIR.mkdir(parents=True, exist_ok=True)
-            error_file.write_text(f"Workflow: {workflow_id}\nNode: {node_id}\nTime: {datetime.now().isoformat()}\n\n{error_content}")
+            _write_bytes(error_file, f"Workflow: {workflow_id}\nNode: {node_id}\nTime: {datetime.now().isoformat()}\n\n{error_content}".encode())
         except IOError:
             pass
 
@@ -109,12 +272,18 @@ class WorkflowLogger:
         return WORKFLOW_LOGS_DIR / f"{workflow_id}_{node_id}.error"
 
 
+# Characters not allowed in tmux session names, and runs of dashes
+_SAN_INVALID = re.compile(r'[^a-zA-Z0-9_-]')
+_SAN_DASHES = re.compile(r'-+')
+
+
+@lru_cache(maxsize=128)
 def sanitize_session_name(name: str) -> str:
     """Sanitize workflow name for use as tmux session name."""
     # Remove/replace invalid characters for tmux session names
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '-', name.lower())
+    sanitized = _SAN_INVALID.sub('-', name.lower())
     # Collapse multiple dashes
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _SAN_DASHES.sub('-', sanitized)
     # Trim to reasonable length
     return sanitized[:50].strip('-')
 
@@ -122,87 +291,80 @@ def sanitize_session_name(name: str) -> str:
 class HookManager:
     """Manages Claude Code hooks for workflow node completion detection."""
 
-    # File to track installed hooks for cleanup
+    # Directory tracking installed hooks for cleanup, one <workflow_id>.json each
+    HOOK_TRACKING_DIR = Path.home() / ".claude" / "workflow_hooks_tracking"
+    # Former single tracking file for all workflows; split up on first use
     HOOK_TRACKING_FILE = Path.home() / ".claude" / "workflow_hooks_tracking.json"
 
     # Directory for workflow state files
     WORKFLOW_STATE_DIR = Path.home() / ".claude" / "workflow_states"
 
-    # Hook script template for Stop event - writes to state file
-    STOP_HOOK_SCRIPT = '''#!/bin/bash
-# Workflow orchestrator Stop hook - auto-generated
-# Do not edit manually - will be cleaned up when workflow completes
-
-# Read hook input from stdin
-INPUT=$(cat)
-SESSION_ID=$(echo "$INPUT" | jq -r '.session_id // empty')
-CWD=$(echo "$INPUT" | jq -r '.cwd // empty')
-STOP_ACTIVE=$(echo "$INPUT" | jq -r '.stop_hook_active // false')
-
-# Avoid infinite loops
-if [ "$STOP_ACTIVE" = "true" ]; then
-    exit 0
-fi
-
-# Write completion state to file
-STATE_DIR="$HOME/.claude/workflow_states"
-WORKFLOW_ID="{workflow_id}"
-NODE_ID="{node_id}"
-STATE_FILE="$STATE_DIR/${{WORKFLOW_ID}}_${{NODE_ID}}.state"
-
-mkdir -p "$STATE_DIR"
-
-cat > "$STATE_FILE" << EOF
-{{
-    "workflow_id": "$WORKFLOW_ID",
-    "node_id": "$NODE_ID",
-    "project": "$(basename "$CWD")",
-    "session_id": "$SESSION_ID",
-    "status": "completed",
-    "timestamp": "$(date -Iseconds)"
-}}
-EOF
-
-exit 0
-'''
+    # Inline Stop hook command (no external file dependency), filled in per node.
+    # It writes the node's state file via rename, so readers never see it half-written
+    STOP_HOOK_COMMAND = (
+        '# {marker}\n'
+        'bash -c \''
+        'mkdir -p "{state_dir}" && '
+        'echo "{{\\"workflow_id\\": \\"{workflow_id}\\", '
+        '\\"node_id\\": \\"{node_id}\\", '
+        '\\"status\\": \\"completed\\", '
+        '\\"timestamp\\": \\"$(date -Iseconds)\\"}}" > "{state_file}.tmp" && '
+        'mv -f "{state_file}.tmp" "{state_file}"'
+        '\''
+    )
 
     def __init__(self, workflow_id: str):
         self.workflow_id = workflow_id
-        self.installed_hooks: dict[str, dict] = {}  # project_path -> hook info
-        self._load_tracking()
+        self._installed_hooks: Optional[dict[str, dict]] = None  # Loaded on first use
+        # node_id -> ((st_mtime_ns, st_size), state) of the last parsed state file
+        self._state_cache: dict[str, tuple[tuple[int, int], dict]] = {}
 
-    def _load_tracking(self):
-        """Load hook tracking from file."""
-        if self.HOOK_TRACKING_FILE.exists():
-            try:
-                with open(self.HOOK_TRACKING_FILE) as f:
-                    data = json.load(f)
-                    # Only load hooks for this workflow
-                    self.installed_hooks = data.get(self.workflow_id, {})
-            except (json.JSONDecodeError, IOError):
-                self.installed_hooks = {}
+    @classmethod
+    def _tracking_path(cls, workflow_id: str) -> Path:
+        return cls.HOOK_TRACKING_DIR / f"{workflow_id}.json"
 
-    def _save_tracking(self):
-        """Save hook tracking to file."""
-        self.HOOK_TRACKING_FILE.parent.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def _migrate_tracking_file(cls):
+        """Split the legacy all-workflows tracking file into per-workflow files."""
+        try:
+            all_tracking = json_loads(cls.HOOK_TRACKING_FILE.read_bytes())
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, IOError):
+            all_tracking = {}
+        cls.HOOK_TRACKING_DIR.mkdir(parents=True, exist_ok=True)
+        for workflow_id, hooks in all_tracking.items():
+            if hooks and not cls._tracking_path(workflow_id).exists():
+                _replace_bytes(cls._tracking_path(workflow_id), json_dumps_bytes(hooks))
+        cls.HOOK_TRACKING_FILE.unlink(missing_ok=True)
 
-        # Load existing tracking for other workflows
-        all_tracking = {}
-        if self.HOOK_TRACKING_FILE.exists():
-            try:
-                with open(self.HOOK_TRACKING_FILE) as f:
-                    all_tracking = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+    @property
+    def installed_hooks(self) -> dict[str, dict]:
+        """project_path -> hook info, read from the tracking file on first access."""
+        return self.load_tracking()
 
-        # Update with our workflow's hooks
-        if self.installed_hooks:
-            all_tracking[self.workflow_id] = self.installed_hooks
-        elif self.workflow_id in all_tracking:
-            del all_tracking[self.workflow_id]
+    def load_tracking(self) -> dict[str, dict]:
+        """Read the tracking file unless already read; returns installed_hooks."""
+        if self._installed_hooks is None:
+            self._installed_hooks = self._load_tracking()
+        return self._installed_hooks
+
+    def _load_tracking(self) -> dict[str, dict]:
+        """Load hook tracking from file."""
+        self._migrate_tracking_file()
+        try:
+            return json_loads(self._tracking_path(self.workflow_id).read_bytes())
+        except (json.JSONDecodeError, IOError):
+            return {}
 
-        with open(self.HOOK_TRACKING_FILE, 'w') as f:
-            json.dump(all_tracking, f, indent=2)
+    def _save_tracking(self):
+        """Save this workflow's hook tracking file."""
+        tracking_file = self._tracking_path(self.workflow_id)
+        if not self.installed_hooks:
+            tracking_file.unlink(missing_ok=True)
+            return
+        self.HOOK_TRACKING_DIR.mkdir(parents=True, exist_ok=True)
+        _replace_bytes(tracking_file, json_dumps_bytes(self.installed_hooks))
 
     def check_existing_hooks(self, project_path: str) -> dict:
         """Check for existing Claude Code hooks in a project."""
@@ -234,9 +396,66 @@ exit 0
 
         return result
 
+    def _hook_command(self, node: WorkflowNode) -> tuple[str, str]:
+        """Return (marker, Stop hook command) for a node."""
+        hook_marker = f"wf-state-{self.workflow_id}-{node.id}"
+        return hook_marker, self.STOP_HOOK_COMMAND.format(
+            marker=hook_marker,
+            state_dir=self.WORKFLOW_STATE_DIR,
+            state_file=self.get_state_file_path(node.id),
+            workflow_id=self.workflow_id,
+            node_id=node.id,
+        )
+
+    @staticmethod
+    def _index_stop_hooks(settings: dict) -> dict[str, list[dict]]:
+        """Map each Stop hook command's "# marker" first line to its hook entries."""
+        # Ensure the Stop hook list exists
+        if "hooks" not in settings:
+            settings["hooks"] = {}
+        if "Stop" not in settings["hooks"]:
+            settings["hooks"]["Stop"] = []
+
+        # Index ALL hooks in each group
+        index = defaultdict(list)
+        for hook_group in settings["hooks"]["Stop"]:
+            if not isinstance(hook_group, dict):
+                continue
+            for h in hook_group.get("hooks", []):
+                if isinstance(h, dict):
+                    index[h.get("command", "").partition("\n")[0]].append(h)
+        return index
+
+    @staticmethod
+    def _register_hook(settings: dict, index: dict[str, list[dict]], hook_marker: str, command: str):
+        """Add or refresh the Stop hook entry tagged with hook_marker in settings."""
+        # Update any existing entries for this workflow/node
+        existing = index.get(f"# {hook_marker}")
+        if existing:
+            for h in existing:
+                h["command"] = command
+            return
+
+        # Add new entry if not found
+        hook = {
+            "type": "command",
+            "command": command,
+            "timeout": 10
+        }
+        settings["hooks"]["Stop"].append({"hooks": [hook]})
+        index[f"# {hook_marker}"].append(hook)
+
     def install_hook(self, node: WorkflowNode) -> bool:
         """Install Stop hook for a workflow node."""
-        project_path = Path(node.project_path)
+        return self.install_hooks_bulk([node])
+
+    def install_hooks_bulk(self, nodes: list[WorkflowNode], save_tracking: bool = True) -> bool:
+        """Install Stop hooks for nodes sharing one project_path.
+
+        settings.json is read and written once for the whole group. With
+        save_tracking=False the caller writes the tracking file (_save_tracking).
+        """
+        project_path = Path(nodes[0].project_path)
         claude_dir = project_path / ".claude"
         settings_file = claude_dir / "settings.json"
 
@@ -244,22 +463,6 @@ exit 0
             # Create .claude directory
             claude_dir.mkdir(parents=True, exist_ok=True)
 
-            # Build inline hook command (no external file dependency)
-            # This writes a state file when Claude stops
-            state_dir = Path.home() / ".claude" / "workflow_states"
-            state_file = state_dir / f"{self.workflow_id}_{node.id}.state"
-            
-            # Inline bash command that writes state file
-            inline_command = (
-                f'bash -c \''
-                f'mkdir -p "{state_dir}" && '
-                f'echo "{{\\"workflow_id\\": \\"{self.workflow_id}\\", '
-                f'\\"node_id\\": \\"{node.id}\\", '
-                f'\\"status\\": \\"completed\\", '
-                f'\\"timestamp\\": \\"$(date -Iseconds)\\"}}" > "{state_file}"'
-                f'\''
-            )
-
             # Update settings.json with hook reference
             settings = {}
             if settings_file.exists():
@@ -269,72 +472,35 @@ exit 0
                 except (json.JSONDecodeError, IOError):
                     settings = {}
 
-            # Add our Stop hook
-            if "hooks" not in settings:
-                settings["hooks"] = {}
-            if "Stop" not in settings["hooks"]:
-                settings["hooks"]["Stop"] = []
-
-            # Check if our hook is already registered - check ALL hooks in each group
-            hook_marker = f"wf-state-{self.workflow_id}-{node.id}"
-            
-            # Find and remove any stale entries for this workflow/node
-            new_stop_hooks = []
-            hook_found = False
-            for hook_group in settings["hooks"]["Stop"]:
-                if not isinstance(hook_group, dict):
-                    new_stop_hooks.append(hook_group)
-                    continue
-                
-                # Check all hooks in this group
-                hooks_list = hook_group.get("hooks", [])
-                has_our_hook = any(
-                    hook_marker in h.get("command", "")
-                    for h in hooks_list
-                    if isinstance(h, dict)
-                )
-                
-                if has_our_hook:
-                    # Update the command
-                    for h in hooks_list:
-                        if isinstance(h, dict) and hook_marker in h.get("command", ""):
-                            h["command"] = f"# {hook_marker}\n{inline_command}"
-                    hook_found = True
-                
-                new_stop_hooks.append(hook_group)
-            
-            settings["hooks"]["Stop"] = new_stop_hooks
-            
-            # Add new entry if not found
-            if not hook_found:
-                settings["hooks"]["Stop"].append({
-                    "hooks": [{
-                        "type": "command",
-                        "command": f"# {hook_marker}\n{inline_command}",
-                        "timeout": 10
-                    }]
-                })
+            markers = []
+            index = self._index_stop_hooks(settings)
+            for node in nodes:
+                hook_marker, command = self._hook_command(node)
+                self._register_hook(settings, index, hook_marker, command)
+                markers.append((node, hook_marker))
 
             # Always write settings to ensure it's current
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # (resolved so a symlinked settings.json keeps its link)
+            _replace_bytes(settings_file.resolve(), json.dumps(settings, indent=2).encode())
 
             # Track installed hook
-            self.installed_hooks[node.project_path] = {
-                "node_id": node.id,
-                "hook_marker": hook_marker,
-                "settings_file": str(settings_file),
-                "installed_at": datetime.now().isoformat()
-            }
-            self._save_tracking()
+            for node, hook_marker in markers:
+                self.installed_hooks[node.project_path] = {
+                    "node_id": node.id,
+                    "hook_marker": hook_marker,
+                    "settings_file": str(settings_file),
+                    "installed_at": datetime.now().isoformat()
+                }
+            if save_tracking:
+                self._save_tracking()
 
             return True
 
         except (IOError, OSError) as e:
-            print(f"Failed to install hook for {node.project_path}: {e}")
+            print(f"Failed to install hook for {project_path}: {e}")
             return False
 
-    def uninstall_hook(self, project_path: str) -> bool:
+    def uninstall_hook(self, project_path: str, save_tracking: bool = True) -> bool:
         """Remove installed hook from a project."""
         if project_path not in self.installed_hooks:
             return True
@@ -366,15 +532,15 @@ exit 0
                         if not settings["hooks"]:
                             del settings["hooks"]
 
-                        with open(settings_file, 'w') as f:
-                            json.dump(settings, f, indent=2)
+                        _replace_bytes(settings_file.resolve(), json.dumps(settings, indent=2).encode())
 
                 except (json.JSONDecodeError, IOError):
                     pass
 
             # Remove from tracking
             del self.installed_hooks[project_path]
-            self._save_tracking()
+            if save_tracking:
+                self._save_tracking()
 
             return True
 
@@ -386,7 +552,9 @@ exit 0
         """Remove all hooks installed by this workflow."""
         paths = list(self.installed_hooks.keys())
         for project_path in paths:
-            self.uninstall_hook(project_path)
+            self.uninstall_hook(project_path, save_tracking=False)
+        if paths:
+            self._save_tracking()
 
     @classmethod
     def cleanup_workflow_hooks(cls, workflow_id: str):
@@ -397,19 +565,16 @@ exit 0
     @classmethod
     def cleanup_all_workflow_hooks(cls):
         """Clean up all tracked workflow hooks (for IDE exit)."""
-        if not cls.HOOK_TRACKING_FILE.exists():
-            return
-
+        cls._migrate_tracking_file()
         try:
-            with open(cls.HOOK_TRACKING_FILE) as f:
-                all_tracking = json.load(f)
-
-            for workflow_id in list(all_tracking.keys()):
-                manager = cls(workflow_id)
-                manager.cleanup_all_hooks()
+            with os.scandir(cls.HOOK_TRACKING_DIR) as it:
+                workflow_ids = [e.name[:-5] for e in it if e.name.endswith(".json")]
+        except OSError:
+            return
 
-        except (json.JSONDecodeError, IOError):
-            pass
+        for workflow_id in workflow_ids:
+            manager = cls(workflow_id)
+            manager.cleanup_all_hooks()
 
     # State file methods for file-based completion detection
 
@@ -431,27 +596,52 @@ exit 0
             "status": "running",
             "timestamp": datetime.now().isoformat()
         }
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        _replace_bytes(state_file, json_dumps_bytes(state))
 
-    def read_node_state(self, node_id: str) -> Optional[dict]:
-        """Read state file for a node. Returns None if not exists."""
+    def scan_states(self) -> dict[str, os.stat_result]:
+        """Stat all of this workflow's state files in one directory pass."""
+        prefix = f"{self.workflow_id}_"
+        try:
+            with os.scandir(self.WORKFLOW_STATE_DIR) as it:
+                return {
+                    e.name: e.stat() for e in it
+                    if e.name.startswith(prefix) and e.name.endswith(".state")
+                }
+        except OSError:
+            return {}
+
+    def read_node_state(self, node_id: str, states: dict[str, os.stat_result] = None) -> Optional[dict]:
+        """Read state file for a node. Returns None if not exists.
+
+        The parsed state is cached and only re-read when the file's mtime or
+        size changes, so polling an unchanged file costs a single stat().
+        Pass the result of scan_states() to skip even that.
+        """
         state_file = self.get_state_file_path(node_id)
-        if not state_file.exists():
+        try:
+            st = os.stat(state_file) if states is None else states[state_file.name]
+        except (OSError, KeyError):
+            self._state_cache.pop(node_id, None)
             return None
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._state_cache.get(node_id)
+        if cached and cached[0] == key:
+            return cached[1]
         try:
-            with open(state_file) as f:
-                return json.load(f)
+            state = json_loads(state_file.read_bytes())
         except (json.JSONDecodeError, IOError):
             return None
+        self._state_cache[node_id] = (key, state)
+        return state
 
-    def is_node_complete(self, node_id: str) -> bool:
+    def is_node_complete(self, node_id: str, states: dict[str, os.stat_result] = None) -> bool:
         """Check if node has completed based on state file."""
-        state = self.read_node_state(node_id)
+        state = self.read_node_state(node_id, states)
         return state is not None and state.get("status") == "completed"
 
     def cleanup_state_file(self, node_id: str):
         """Remove state file for a node."""
+        self._state_cache.pop(node_id, None)
         state_file = self.get_state_file_path(node_id)
         if state_file.exists():
             try:
@@ -461,105 +651,323 @@ exit 0
 
     def cleanup_all_state_files(self):
         """Remove all state files for this workflow."""
-        if not self.WORKFLOW_STATE_DIR.exists():
-            return
-        for state_file in self.WORKFLOW_STATE_DIR.glob(f"{self.workflow_id}_*.state"):
+        self._state_cache.clear()
+        for name in self.scan_states():
             try:
-                state_file.unlink()
+                os.unlink(self.WORKFLOW_STATE_DIR / name)
             except OSError:
                 pass
 
 
+class StateDirWatcher:
+    """Sets an asyncio.Event as soon as a state file is written (Linux inotify).
+
+    Use StateDirWatcher.start(); it returns None where inotify or loop readers
+    aren't available, in which case callers keep to timed polling.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+
+    def __init__(self, path: Path, loop: asyncio.AbstractEventLoop, event: asyncio.Event):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO
+            if libc.inotify_add_watch(self._fd, os.fsencode(path), mask) < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+            self._loop = loop
+            self._changed = event
+            loop.add_reader(self._fd, self._on_readable)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    @classmethod
+    def start(cls, path: Path, event: asyncio.Event) -> Optional["StateDirWatcher"]:
+        """Watch path from the running loop, or None if unsupported here."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            return cls(path, asyncio.get_running_loop(), event)
+        except (OSError, AttributeError, NotImplementedError):
+            return None
+
+    def _on_readable(self):
+        # Drain the queued events; which file changed doesn't matter
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._changed.set()
+
+    def close(self):
+        self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+
+
+class TmuxControlClient:
+    """Persistent tmux control-mode (tmux -C) connection.
+
+    Commands are written to the client's stdin and their output is read back
+    from the %begin/%end block tmux frames it in, so running a command costs a
+    pipe round trip instead of a fork/exec of a new tmux client.
+    """
+
+    # Seconds to wait for each line of a reply before giving up on the client
+    READ_TIMEOUT = 2.0
+
+    # Escapes for the tmux command parser inside double quotes
+    _QUOTE_TABLE = {
+        **{ord(c): "\\" + c for c in '\\"$'},
+        **{i: f"\\{i:03o}" for i in (*range(32), 127)},
+    }
+
+    def __init__(self, session: str):
+        cmd = ["tmux"]
+        env = dict(os.environ)
+        # Attaching from inside tmux is refused while $TMUX is set; drop it but
+        # keep talking to the same server socket
+        tmux_env = env.pop("TMUX", "")
+        if tmux_env:
+            cmd += ["-S", tmux_env.split(",")[0]]
+        cmd += ["-C", "attach-session", "-t", session, "-f", "ignore-size,no-output"]
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            cmd, env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, errors="replace", bufsize=1,
+        )
+        # Set when a sent command got no reply; the client is then unusable
+        self.dead = False
+        # Output lines, fed by a reader thread so waits can time out; None at EOF
+        self._rows: queue.Queue[Optional[str]] = queue.Queue()
+        threading.Thread(target=self._read_rows, daemon=True).start()
+
+    def _read_rows(self):
+        for row in self._proc.stdout:
+            self._rows.put(row)
+        self._rows.put(None)
+
+    @classmethod
+    def quote(cls, arg: str) -> str:
+        """Quote an argument for the tmux command parser (a bare ";" separates commands)."""
+        if arg == ";":
+            return arg
+        quoted = arg.translate(cls._QUOTE_TABLE)
+        if quoted.startswith("~"):
+            quoted = "\\" + quoted
+        return f'"{quoted}"'
+
+    def run(self, *args) -> subprocess.CompletedProcess:
+        """Run a tmux command (or ";"-separated sequence).
+
+        Raises OSError if the command could not be sent, so it can safely be run
+        another way. Once sent, a missing reply fails the command and marks the
+        client dead instead: tmux may already have run it.
+        """
+        line = " ".join(self.quote(arg) for arg in args) + "\n"
+        # tmux answers each command with its own block and drops the rest of
+        # the sequence after the first error
+        pending = args.count(";") + 1
+        stdout = []
+        with self._lock:
+            self._proc.stdin.write(line)
+            self._proc.stdin.flush()
+            try:
+                while pending:
+                    ok, output = self._read_block()
+                    if not ok:
+                        return subprocess.CompletedProcess(["tmux", *args], 1, "".join(stdout), output)
+                    stdout.append(output)
+                    pending -= 1
+            except (OSError, ValueError) as e:
+                self.dead = True
+                reason = "timeout" if isinstance(e, TimeoutError) else str(e)
+                return subprocess.CompletedProcess(["tmux", *args], 1, "".join(stdout), reason)
+        return subprocess.CompletedProcess(["tmux", *args], 0, "".join(stdout), "")
+
+    def _read_block(self) -> tuple[bool, str]:
+        """Read the next %begin..%end/%error block sent for one of our commands."""
+        guard = None
+        output = []
+        while True:
+            try:
+                row = self._rows.get(timeout=self.READ_TIMEOUT)
+            except queue.Empty:
+                raise TimeoutError("tmux control client stopped answering") from None
+            if row is None:
+                raise BrokenPipeError("tmux control client exited")
+            row = row.rstrip("\n")
+            if guard is None:
+                # Skip notifications and blocks for commands we didn't send
+                parts = row.split()
+                if parts and parts[0] == "%begin" and len(parts) > 3 and int(parts[3]) & 1:
+                    guard = parts[1:3]
+                continue
+            if row.startswith(("%end ", "%error ")) and row.split()[1:3] == guard:
+                return row.startswith("%end"), "".join(f"{out}\n" for out in output)
+            output.append(row)
+
+    def close(self):
+        """Detach the control client."""
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+
+
 class TmuxExecutor:
     """Manages workflow execution via dedicated workflow tmux session."""
 
+    # get_pane_status keys and the tmux formats behind them
+    _PANE_STATUS = (
+        ("pid", "pane_pid"),
+        ("command", "pane_current_command"),
+        ("window_name", "window_name"),
+        ("history_size", "history_size"),
+        ("in_mode", "pane_in_mode"),
+        ("cursor_x", "cursor_x"),
+        ("cursor_y", "cursor_y"),
+        ("pane_height", "pane_height"),
+    )
+    PANE_STATUS_FIELDS = tuple(key for key, _ in _PANE_STATUS)
+    PANE_STATUS_FORMAT = "\t".join(f"#{{{fmt}}}" for _, fmt in _PANE_STATUS)
+    PANE_STATUS_INTS = ("history_size", "in_mode", "cursor_x", "cursor_y", "pane_height")
+
     def __init__(self, workflow_name: str = "default"):
         # Use wf-{project_name} convention for session naming
         self.session = f"wf-{sanitize_session_name(workflow_name)}"
         self.active_panes: dict[str, str] = {}  # node_id -> pane_id
+        self._control: Optional[TmuxControlClient] = None
+        self._control_failed = False
         self._ensure_session_exists()
 
     def _ensure_session_exists(self):
         """Create the workflow session if it doesn't exist."""
-        result = subprocess.run(
-            ["tmux", "has-session", "-t", self.session],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            # Session doesn't exist, create it detached
-            subprocess.run(
-                ["tmux", "new-session", "-d", "-s", self.session],
-                capture_output=True, text=True
-            )
-            # Apply theme colors to workflow session status bar
+        # new-session fails on an existing session, which also drops the
+        # rest of the sequence, so the theme is only applied to a new session
+        args = ["tmux", "new-session", "-d", "-s", self.session]
+        # Apply theme colors to workflow session status bar
+        try:
+            from config_panel import get_theme_colors
+            theme = get_theme_colors()
+            args += [
+                ";", "set-option", "-t", self.session,
+                "status-style", f"bg={theme['bg']},fg={theme['fg']}"
+            ]
+        except Exception:
+            pass  # Fall back to default if theme loading fails
+        subprocess.run(args, capture_output=True, text=True)
+
+    def _control_client(self) -> Optional[TmuxControlClient]:
+        """Lazily open the control-mode connection (None once it has failed)."""
+        if self._control is None and not self._control_failed:
             try:
-                from config_panel import get_theme_colors
-                theme = get_theme_colors()
-                subprocess.run([
-                    "tmux", "set-option", "-t", self.session,
-                    "status-style", f"bg={theme['bg']},fg={theme['fg']}"
-                ])
-            except Exception:
-                pass  # Fall back to default if theme loading fails
+                self._control = TmuxControlClient(self.session)
+            except OSError:
+                self._control_failed = True
+        return self._control
+
+    def close(self):
+        """Close the control-mode connection, if open."""
+        if self._control:
+            self._control.close()
+            self._control = None
 
     def _run_tmux(self, *args, log_errors: bool = False) -> subprocess.CompletedProcess:
-        """Run a tmux command."""
-        result = subprocess.run(
-            ["tmux"] + list(args),
-            capture_output=True, text=True
-        )
+        """Run a tmux command, over the control connection when available."""
+        result = None
+        control = self._control_client()
+        if control:
+            try:
+                result = control.run(*args)
+            except (OSError, ValueError):
+                # Command not sent (old tmux, session gone): fork per command
+                self._control_failed = True
+                self.close()
+            else:
+                if control.dead:
+                    # Sent but unanswered: don't run it twice, fork for later commands
+                    self._control_failed = True
+                    self.close()
+        if result is None:
+            result = subprocess.run(
+                ["tmux"] + list(args),
+                capture_output=True, text=True
+            )
         if log_errors and result.returncode != 0:
-            import sys
             print(f"tmux {' '.join(args)} failed: {result.stderr}", file=sys.stderr)
         return result
 
-    def create_workflow_window(self, node: WorkflowNode) -> str:
-        """Create or reuse a tmux window for workflow node execution."""
-        window_name = f"wf-{node.id}"
-        window_target = f"{self.session}:{window_name}"
+    async def _run_tmux_async(self, *args) -> subprocess.CompletedProcess:
+        """Run a tmux command without blocking the event loop."""
+        if self._control_client():
+            return await asyncio.to_thread(self._run_tmux, *args)
+        proc = await asyncio.create_subprocess_exec(
+            "tmux", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        return subprocess.CompletedProcess(
+            ["tmux", *args], proc.returncode,
+            stdout.decode(errors="replace"), stderr.decode(errors="replace")
+        )
 
-        # Check if window already exists
-        result = self._run_tmux("list-windows", "-t", self.session, "-F", "#{window_name}")
-        existing_windows = result.stdout.strip().split("\n") if result.stdout.strip() else []
+    def _window_pane_args(self) -> tuple:
+        """list-panes arguments yielding "window_name pane_id" for the whole session."""
+        return ("list-panes", "-s", "-t", self.session, "-F", "#{window_name} #{pane_id}")
 
-        if window_name in existing_windows:
-            # Window exists - get its pane ID and reset it
-            result = self._run_tmux(
-                "list-panes", "-t", window_target,
-                "-F", "#{pane_id}"
-            )
-            pane_id = result.stdout.strip().split("\n")[0] if result.stdout.strip() else ""
-            
-            if pane_id:
-                # Send Ctrl+C to stop any running process, then clear
-                self._run_tmux("send-keys", "-t", pane_id, "C-c")
-                import time
-                time.sleep(0.2)
-                self._run_tmux("send-keys", "-t", pane_id, "C-c")
-                time.sleep(0.2)
-                # Change to the project directory
-                self.send_text(pane_id, f"cd '{node.project_path}'")
-                self.send_enter(pane_id)
-                time.sleep(0.1)
-                self._run_tmux("send-keys", "-t", pane_id, "clear", "Enter")
-                time.sleep(0.1)
-                
-                self.active_panes[node.id] = pane_id
+    @staticmethod
+    def _find_window_pane(listing: str, window_name: str) -> str:
+        """First pane of window_name in _window_pane_args output, or ""."""
+        for line in listing.splitlines():
+            name, _, pane_id = line.partition(" ")
+            if name == window_name:
                 return pane_id
-        
+        return ""
+
+    @staticmethod
+    def _reset_pane_args(pane_id: str, project_path: str) -> tuple:
+        """One tmux command sequence that gives the pane a fresh shell in the project.
+
+        Respawning replaces typing Ctrl+C, cd and clear into the old shell: the
+        tty flushes input queued behind an interrupt, which ate the start of the cd.
+        """
+        return (
+            "respawn-pane", "-k", "-t", pane_id, "-c", project_path, ";",
+            "clear-history", "-t", pane_id,
+        )
+
+    async def launch_pane_async(self, node: WorkflowNode) -> str:
+        """Create or reuse the node's tmux window without blocking, so nodes can launch concurrently."""
+        window_name = f"wf-{node.id}"
+
+        # Check if window already exists - get its pane ID and reset it
+        result = await self._run_tmux_async(*self._window_pane_args())
+        pane_id = self._find_window_pane(result.stdout, window_name)
+        if pane_id:
+            await self._run_tmux_async(*self._reset_pane_args(pane_id, node.project_path))
+            self.active_panes[node.id] = pane_id
+            return pane_id
+
         # Window doesn't exist - create new one
-        result = self._run_tmux(
+        result = await self._run_tmux_async(
             "new-window", "-t", self.session,
             "-n", window_name,
             "-c", node.project_path,
             "-P", "-F", "#{pane_id}"
         )
-        
+
         if result.returncode != 0:
-            import sys
             print(f"Failed to create window: {result.stderr}", file=sys.stderr)
             return ""
-            
+
         pane_id = result.stdout.strip()
 
         if pane_id:
@@ -580,51 +988,86 @@ class TmuxExecutor:
         """Send Enter key to a tmux pane."""
         self._run_tmux("send-keys", "-t", pane_id, "Enter")
 
-    def send_prompt_to_claude(self, pane_id: str, prompt: str):
-        """Start claude and send a prompt."""
-        import time
-        
+    async def send_prompt_to_claude_async(self, pane_id: str, prompt: str):
+        """Start claude with a prompt in the pane."""
+        await self._run_tmux_async(*self._prompt_args(pane_id, prompt))
+
+    def _prompt_args(self, pane_id: str, prompt: str) -> tuple:
+        """Type the claude command, then Enter, as one tmux command sequence."""
+        # tmux queues the two send-keys in order, so no pause is needed between them
+        return (
+            "send-keys", "-t", pane_id, "-l", self._claude_command(prompt), ";",
+            "send-keys", "-t", pane_id, "Enter",
+        )
+
+    @staticmethod
+    def _claude_command(prompt: str) -> str:
+        """Build the shell command that starts claude with a prompt."""
         # Method 1: Send claude command with prompt as heredoc
         # This is more reliable for multi-line prompts
-        
+
         # Escape any single quotes in the prompt
         escaped_prompt = prompt.replace("'", "'\"'\"'")
-        
+
         # Build command: claude 'prompt text'
-        command = f"claude '{escaped_prompt}'"
-        
-        # Send the command
-        self.send_text(pane_id, command)
-        time.sleep(0.1)
-        self.send_enter(pane_id)
+        return f"claude '{escaped_prompt}'"
+
+    @staticmethod
+    def _capture_args(pane_id: str, lines: int) -> tuple:
+        """capture-pane arguments for `lines` of scrollback plus the screen (0: screen only)."""
+        if lines:
+            return ("capture-pane", "-t", pane_id, "-p", "-S", f"-{lines}")
+        return ("capture-pane", "-t", pane_id, "-p")
 
     def capture_pane_output(self, pane_id: str, lines: int = 100) -> str:
         """Capture recent output from a pane."""
-        result = self._run_tmux(
-            "capture-pane", "-t", pane_id, "-p", "-S", f"-{lines}"
-        )
+        return self._run_tmux(*self._capture_args(pane_id, lines)).stdout
+
+    async def capture_pane_output_async(self, pane_id: str, lines: int = 100) -> str:
+        """Capture recent output from a pane without blocking the event loop."""
+        result = await self._run_tmux_async(*self._capture_args(pane_id, lines))
         return result.stdout
 
+    @classmethod
+    def _parse_pane_status(cls, stdout: str) -> dict:
+        parts = stdout.rstrip("\n").split("\t")
+        if len(parts) != len(cls.PANE_STATUS_FIELDS):
+            return {}
+        status = dict(zip(cls.PANE_STATUS_FIELDS, parts))
+        for key in cls.PANE_STATUS_INTS:
+            try:
+                status[key] = int(status[key])
+            except ValueError:
+                return {}
+        return status
+
+    def get_pane_status(self, pane_id: str) -> dict:
+        """Everything the poll loop needs about a pane from one display-message.
+
+        Keys are PANE_STATUS_FIELDS; empty if the pane is gone.
+        """
+        result = self._run_tmux("display-message", "-t", pane_id, "-p", self.PANE_STATUS_FORMAT)
+        return self._parse_pane_status(result.stdout)
+
+    async def get_pane_status_async(self, pane_id: str) -> dict:
+        """get_pane_status without blocking the event loop."""
+        result = await self._run_tmux_async(
+            "display-message", "-t", pane_id, "-p", self.PANE_STATUS_FORMAT
+        )
+        return self._parse_pane_status(result.stdout)
+
     def get_pane_info(self, pane_id: str) -> dict:
         """Get detailed pane information."""
-        result = self._run_tmux(
-            "display-message", "-t", pane_id, "-p",
-            "#{pane_pid}:#{pane_current_command}:#{window_name}"
-        )
-        parts = result.stdout.strip().split(":")
-        if len(parts) >= 3:
-            return {
-                "pid": parts[0],
-                "command": parts[1],
-                "window_name": parts[2],
-            }
-        return {}
-
-    def is_pane_idle(self, pane_id: str) -> bool:
-        """Check if pane is back at shell prompt (command finished)."""
-        info = self.get_pane_info(pane_id)
-        command = info.get("command", "")
-        return command in ("zsh", "bash", "fish", "-zsh", "-bash")
+        return self.get_pane_status(pane_id)
+
+    def is_pane_idle(self, pane_id: str, status: dict = None) -> bool:
+        """Check if pane is back at shell prompt (command finished).
+
+        Pass a get_pane_status() result to avoid another tmux call.
+        """
+        if status is None:
+            status = self.get_pane_status(pane_id)
+        return status.get("command", "") in SHELL_SET
 
     def kill_window(self, window_name: str):
         """Kill a workflow window."""
@@ -633,29 +1076,34 @@ class TmuxExecutor:
     def cleanup_old_windows(self, keep_node_ids: set[str] = None):
         """Remove workflow windows not in the keep list."""
         keep_node_ids = keep_node_ids or set()
-        windows = self.list_workflow_windows()
-        
-        for window in windows:
+        # Kill all stale windows with one ";"-separated tmux command
+        args = []
+        for window in self.list_workflow_windows():
             if window["node_id"] not in keep_node_ids:
-                self.kill_window(window["name"])
+                args += ["kill-window", "-t", f"{self.session}:{window['name']}", ";"]
+        if args:
+            self._run_tmux(*args[:-1])
 
     def list_workflow_windows(self) -> list[dict]:
         """List all workflow-related windows in claude-code session."""
+        fmt = "#{window_name}\t#{window_index}\t#{pane_id}"
+        # Let tmux drop non-workflow windows (-f needs tmux 3.2+)
         result = self._run_tmux(
             "list-windows", "-t", self.session,
-            "-F", "#{window_name}:#{window_index}:#{pane_id}"
+            "-f", "#{m:wf-*,#{window_name}}", "-F", fmt
         )
+        if result.returncode != 0:
+            result = self._run_tmux("list-windows", "-t", self.session, "-F", fmt)
         windows = []
-        for line in result.stdout.strip().split("\n"):
-            if line.startswith("wf-"):
-                parts = line.split(":")
-                if len(parts) >= 3:
-                    windows.append({
-                        "name": parts[0],
-                        "index": parts[1],
-                        "pane_id": parts[2],
-                        "node_id": parts[0].replace("wf-", ""),
-                    })
+        for line in result.stdout.split("\n"):
+            parts = line.split("\t", 2)
+            if len(parts) == 3 and parts[0].startswith("wf-"):
+                windows.append({
+                    "name": parts[0],
+                    "index": parts[1],
+                    "pane_id": parts[2],
+                    "node_id": parts[0][3:],
+                })
         return windows
 
     def focus_window(self, window_name: str):
@@ -666,6 +1114,23 @@ class TmuxExecutor:
 class WorkflowOrchestrator:
     """Orchestrates workflow chain execution."""
 
+    # Seconds between polls (and between tmux pane completion checks)
+    POLL_INTERVAL = 2
+    # Longest sleep when state file writes wake the loop; pane fallbacks run this often
+    WAKE_TIMEOUT = 5
+    # First sleep after a node starts or finishes; doubles each quiet tick up to the above
+    MIN_POLL_INTERVAL = 0.1
+    # A cached pane capture is re-taken after this long even if the pane looks unchanged
+    TAIL_REFRESH_INTERVAL = 10
+
+    # Minimum seconds between workflow saves for node starts and completions
+    SAVE_INTERVAL = 2
+    # Seconds between log flushes from the poll loop; node completions flush at once
+    LOG_FLUSH_INTERVAL = 2
+
+    # Characters of a completed node's pane output kept on node.output and propagated
+    OUTPUT_TAIL_CHARS = 2000
+
     # Markers that indicate Claude session has ended
     COMPLETION_MARKERS = [
         "Session ended",
@@ -674,6 +1139,17 @@ class WorkflowOrchestrator:
         "❯",        # zsh prompt
         "$ ",       # bash prompt
     ]
+    _MARKER_RE = re.compile("|".join(re.escape(m) for m in COMPLETION_MARKERS))
+    _MARKER_AUTOMATON = _marker_automaton(COMPLETION_MARKERS)
+
+    # Words in a finished pane's last lines that mean Claude completed the task
+    SUCCESS_INDICATORS = [
+        "ready to use", "successfully", "completed", "done",
+        "created", "updated", "fixed", "working", "finished"
+    ]
+    _SUCCESS_RE = re.compile("|".join(re.escape(s) for s in SUCCESS_INDICATORS), re.IGNORECASE)
+    _ERROR_RE = re.compile("error", re.IGNORECASE)
+    _ERROR_LINE_RE = re.compile("^.*error.*$", re.IGNORECASE | re.MULTILINE)
 
     def __init__(self, chain: WorkflowChain, on_status_change: Callable = None):
         self.chain = chain
@@ -683,14 +1159,48 @@ class WorkflowOrchestrator:
         self.hook_manager = HookManager(workflow_id=chain.id)
         # Initialize per-workflow logger
         self.log = WorkflowLogger(workflow_id=chain.id, workflow_name=chain.name)
-        self.accumulated_context = chain.global_context
+        self._global_context = chain.global_context
+        # Completed node outputs, joined only when a prompt is built
+        self._context_chunks: list[str] = []
         self.on_status_change = on_status_change or (lambda: None)
         self._running = False
-        self._paused = False
+        # Set while not paused; the poll loop waits on it during a pause
+        self._unpaused = asyncio.Event()
+        self._unpaused.set()
         self._hooks_installed = False
+        # Set by state file writes and user actions to end the poll loop's sleep early
+        self._wake = asyncio.Event()
+        # Nodes started by this run and not yet completed, by id
+        self._running_nodes: dict[str, WorkflowNode] = {}
+        # Set whenever a node finishes or is reset, so the loop rechecks
+        # is_complete() and get_runnable_nodes() only then
+        self._nodes_changed = True
+        # node_id -> time.monotonic() at start; started_at stays for display/storage
+        self._started_monotonic: dict[str, float] = {}
+        # node_id -> (history key, lines, text, monotonic time) of the last pane capture
+        self._pane_tails: dict[str, tuple] = {}
+        # Node starts/completions not yet written by save_workflow
+        self._save_dirty = False
+        self._last_save = 0.0
+        # node_id -> (inputs, prompt) of the last _build_prompt for the node
+        self._prompts: dict[str, tuple[tuple, str]] = {}
+
+    @property
+    def accumulated_context(self) -> str:
+        """Global context followed by the output of each completed node."""
+        return self._global_context + "".join(self._context_chunks)
 
     def _build_prompt(self, node: WorkflowNode) -> str:
-        """Build full prompt for a node."""
+        """Build full prompt for a node (reused while its inputs are unchanged)."""
+        # Context chunks are only ever appended, so their count stands in for the text
+        inputs = (
+            self.chain.global_context, self.chain.propagate_output, len(self._context_chunks),
+            node.prompt_template, tuple(node.context_files), node.project_path,
+        )
+        cached = self._prompts.get(node.id)
+        if cached and cached[0] == inputs:
+            return cached[1]
+
         parts = []
 
         # Global context
@@ -698,8 +1208,10 @@ class WorkflowOrchestrator:
             parts.append(f"## Global Context\n{self.chain.global_context}")
 
         # Accumulated output from previous nodes
-        if self.chain.propagate_output and self.accumulated_context != self.chain.global_context:
-            parts.append(f"## Context from Previous Steps\n{self.accumulated_context}")
+        if self.chain.propagate_output and self._context_chunks:
+            parts.append("".join(
+                ["## Context from Previous Steps\n", self._global_context, *self._context_chunks]
+            ))
 
         # Node-specific prompt
         if node.prompt_template:
@@ -714,25 +1226,43 @@ class WorkflowOrchestrator:
         if not parts:
             parts.append(f"Work on the project at: {node.project_path}")
 
-        return "\n\n".join(parts)
+        prompt = "\n\n".join(parts)
+        self._prompts[node.id] = (inputs, prompt)
+        return prompt
 
-    def _install_hooks_for_nodes(self):
+    async def _install_hooks_for_nodes(self):
         """Install Claude Code hooks for all nodes before execution."""
         self.log.info(f"Installing hooks for {len(self.chain.nodes)} nodes")
+        # Group by project so each settings.json is read and written once
+        by_project: dict[str, list[WorkflowNode]] = defaultdict(list)
         for node in self.chain.nodes:
             if node.project_path:
-                try:
-                    # Always install/reinstall the hook to ensure file exists
-                    # This handles cases where file was deleted but settings reference remains
-                    result = self.hook_manager.install_hook(node)
-                    if result:
-                        self.log.info(f"[{node.id}] Hook installed for {node.project_name}")
-                    else:
-                        self.log.error(f"[{node.id}] Hook installation failed")
-                except Exception as e:
-                    self.log.error(f"[{node.id}] Hook installation error: {e}")
-                    import traceback
-                    self.log.error(f"[{node.id}] Traceback:\n{traceback.format_exc()}")
+                by_project[node.project_path].append(node)
+
+        # Projects are independent files: update them in parallel threads and
+        # write the tracking file once at the end. Load tracking up front so
+        # the threads don't race to do it
+        self.hook_manager.load_tracking()
+        groups = list(by_project.values())
+        # Always install/reinstall the hook to ensure file exists
+        # This handles cases where file was deleted but settings reference remains
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.hook_manager.install_hooks_bulk, nodes, save_tracking=False)
+              for nodes in groups),
+            return_exceptions=True,
+        )
+        self.hook_manager._save_tracking()
+
+        for nodes, result in zip(groups, results):
+            node_ids = ", ".join(node.id for node in nodes)
+            if isinstance(result, Exception):
+                self.log.error(f"[{node_ids}] Hook installation error: {result}")
+                tb = "".join(traceback.format_exception(result))
+                self.log.error(f"[{node_ids}] Traceback:\n{tb}")
+            elif result:
+                self.log.info(f"[{node_ids}] Hook installed for {nodes[0].project_name}")
+            else:
+                self.log.error(f"[{node_ids}] Hook installation failed")
 
         self._hooks_installed = True
         self.log.info("Hook installation complete")
@@ -742,86 +1272,146 @@ class WorkflowOrchestrator:
         if self._hooks_installed:
             self.hook_manager.cleanup_all_hooks()
             self._hooks_installed = False
+        self.log.flush()
 
-    def _check_node_completion(self, node: WorkflowNode) -> bool:
-        """Check if a node has completed via state file or tmux pane."""
-        # Grace period: don't check completion for first 5 seconds
-        # This prevents false positives when shell is still visible before Claude starts
-        if node.started_at:
-            started = datetime.fromisoformat(node.started_at)
-            elapsed = (datetime.now() - started).total_seconds()
-            if elapsed < 5:
-                self.log.debug(f"[{node.id}] Grace period: {elapsed:.1f}s < 5s")
-                return False
-
-        # Primary: Check state file written by Stop hook
-        if self.hook_manager.is_node_complete(node.id):
+    @classmethod
+    def _trim_capture(cls, text: str, lines: int, height: int) -> str:
+        """Cut a capture-pane -S -N text down to `lines` history lines plus the screen."""
+        # A trailing newline ends the last line rather than starting another
+        return text[cls._tail_offset(text, lines + height + text.endswith("\n")):]
+
+    async def _capture_tail(self, node: WorkflowNode, lines: int, status: dict = None) -> str:
+        """capture_pane_output for a node's pane, reusing the last capture when unchanged.
+
+        The pane's history size and cursor (from status, or a fresh
+        get_pane_status) decide whether anything was printed since the last
+        capture of at least `lines` lines.
+        """
+        if status is None:
+            status = await self.executor.get_pane_status_async(node.tmux_pane)
+        key = (
+            (status["history_size"], status["cursor_x"], status["cursor_y"], status["pane_height"])
+            if status else None
+        )
+        cached = self._pane_tails.get(node.id)
+        now = time.monotonic()
+        if (key and cached and cached[0] == key and cached[1] >= lines
+                and now - cached[3] < self.TAIL_REFRESH_INTERVAL):
+            return self._trim_capture(cached[2], lines, key[3]) if cached[1] > lines else cached[2]
+        text = await self.executor.capture_pane_output_async(node.tmux_pane, lines)
+        self._pane_tails[node.id] = (key, lines, text, now)
+        return text
+
+    async def _check_node_completion(self, node: WorkflowNode, states: dict = None,
+                                     check_panes: bool = True) -> bool:
+        """Check if a node has completed via state file or tmux pane.
+
+        states is this tick's HookManager.scan_states() result, if available.
+        With check_panes=False only the state file is consulted.
+        """
+        # Primary: Check state file written by Stop hook. It can't be a false
+        # positive, so it needs neither the grace period nor a tmux query
+        if self.hook_manager.is_node_complete(node.id, states):
             self.log.node_event(node.id, "Completed via state file")
             return True
 
         # Fallback: Check tmux pane state
-        if not node.tmux_pane:
+        if not check_panes or not node.tmux_pane:
             return False
 
+        # Grace period: don't check the pane for first 5 seconds
+        # This prevents false positives when shell is still visible before Claude starts
+        started = self._started_monotonic.get(node.id)
+        if started is None and node.started_at:
+            # Started before this orchestrator (e.g. a resumed run): parse once
+            age = (datetime.now() - datetime.fromisoformat(node.started_at)).total_seconds()
+            started = self._started_monotonic[node.id] = time.monotonic() - age
+        if started is not None:
+            elapsed = time.monotonic() - started
+            if elapsed < 5:
+                self.log.debug("[%s] Grace period: %.1fs < 5s", node.id, elapsed)
+                return False
+
+        # One display-message covers both the idle check and the capture cache
+        status = await self.executor.get_pane_status_async(node.tmux_pane)
+
         # Check if shell is idle (command finished)
-        if self.executor.is_pane_idle(node.tmux_pane):
+        if self.executor.is_pane_idle(node.tmux_pane, status):
             self.log.node_event(node.id, "Completed via pane idle")
             return True
 
-        # Also check output for completion markers
-        output = self.executor.capture_pane_output(node.tmux_pane, 20)
-        if any(marker in output for marker in self.COMPLETION_MARKERS):
+        # Also check output for completion markers (they sit on the visible screen)
+        output = await self._capture_tail(node, 0, status)
+        if self._has_completion_marker(output):
             self.log.node_event(node.id, "Completed via output marker")
             return True
 
         return False
 
-    def execute_node(self, node: WorkflowNode):
+    @staticmethod
+    def _tail_offset(text: str, lines: int) -> int:
+        """Offset at which the last `lines` newline-separated lines of text start."""
+        pos = len(text)
+        for _ in range(lines):
+            pos = text.rfind("\n", 0, pos)
+            if pos < 0:
+                break
+        return pos + 1
+
+    def _has_completion_marker(self, output: str) -> bool:
+        """Whether output contains any COMPLETION_MARKERS, in one pass."""
+        if self._MARKER_AUTOMATON is not None:
+            return next(self._MARKER_AUTOMATON.iter(output), None) is not None
+        return self._MARKER_RE.search(output) is not None
+
+    async def execute_node(self, node: WorkflowNode):
         """Execute a single workflow node."""
         self.log.info(f"[{node.id}] Starting execution for project={node.project_name}")
 
         # Create window in workflow session
         try:
-            pane_id = self.executor.create_workflow_window(node)
+            pane_id = await self.executor.launch_pane_async(node)
         except Exception as e:
-            node.status = NodeStatus.FAILED
+            self.chain.set_status(node, NodeStatus.FAILED)
             node.error_message = f"Failed to create tmux window: {e}"
             self.log.error(f"[{node.id}] {node.error_message}")
-            import traceback
             self.log.error(f"[{node.id}] Traceback:\n{traceback.format_exc()}")
             return
 
         if not pane_id:
-            node.status = NodeStatus.FAILED
+            self.chain.set_status(node, NodeStatus.FAILED)
             node.error_message = "Failed to create tmux window (no pane_id returned)"
             self.log.error(f"[{node.id}] {node.error_message}")
             return
 
         node.tmux_pane = pane_id
-        node.status = NodeStatus.RUNNING
+        self.chain.set_status(node, NodeStatus.RUNNING)
+        self._running_nodes[node.id] = node
         node.started_at = datetime.now().isoformat()
-        self.log.debug(f"[{node.id}] Tmux pane: {pane_id}")
+        self._started_monotonic[node.id] = time.monotonic()
+        self.log.debug("[%s] Tmux pane: %s", node.id, pane_id)
 
         # Create pending state file for this node
         self.hook_manager.create_pending_state(node.id)
-        self.log.debug(f"[{node.id}] State file created")
+        self.log.debug("[%s] State file created", node.id)
 
         # Build the prompt
         prompt = self._build_prompt(node)
-        self.log.debug(f"[{node.id}] Prompt length: {len(prompt)} chars")
+        self.log.debug("[%s] Prompt length: %d chars", node.id, len(prompt))
 
         # Send prompt to claude using tmux send-keys
         try:
-            self.executor.send_prompt_to_claude(pane_id, prompt)
+            await self.executor.send_prompt_to_claude_async(pane_id, prompt)
             self.log.info(f"[{node.id}] Claude started in pane={pane_id}")
         except Exception as e:
-            node.status = NodeStatus.FAILED
+            self.chain.set_status(node, NodeStatus.FAILED)
             node.error_message = f"Failed to send prompt: {e}"
             self.log.error(f"[{node.id}] {node.error_message}")
             return
 
         self.on_status_change()
-        save_workflow(self.chain)
+        # Saved by the poll loop, at most once per SAVE_INTERVAL
+        self._save_dirty = True
 
     def complete_node(self, node: WorkflowNode, success: bool = True):
         """Mark a node as completed."""
@@ -829,23 +1419,37 @@ class WorkflowOrchestrator:
         duration = node.duration_str
 
         if success:
-            node.status = NodeStatus.COMPLETED
+            self.chain.set_status(node, NodeStatus.COMPLETED)
             self.log.info(f"[{node.id}] Completed successfully - duration={duration}")
             # Capture output for context propagation
             if node.tmux_pane:
-                node.output = self.executor.capture_pane_output(node.tmux_pane)
+                cached = self._pane_tails.get(node.id)
+                if cached and cached[0] and cached[1] >= 100:
+                    # Captured by the completion check this tick
+                    full = self._trim_capture(cached[2], 100, cached[0][3])
+                else:
+                    full = self.executor.capture_pane_output(node.tmux_pane)
+                # Only the tail is propagated, so only the tail is kept (and saved)
+                node.output = full[-self.OUTPUT_TAIL_CHARS:]
                 if self.chain.propagate_output:
-                    self.accumulated_context += f"\n\n## Output from {node.project_name}:\n{node.output[-2000:]}"
+                    self._context_chunks.append(f"\n\n## Output from {node.project_name}:\n{node.output}")
         else:
-            node.status = NodeStatus.FAILED
+            self.chain.set_status(node, NodeStatus.FAILED)
             error_info = f", error={node.error_message}" if node.error_message else ""
             self.log.error(f"[{node.id}] Failed - duration={duration}{error_info}")
 
         # Clean up state file (hook stays until workflow completes)
         self.hook_manager.cleanup_state_file(node.id)
+        self._pane_tails.pop(node.id, None)
+        self._running_nodes.pop(node.id, None)
+        self.log.flush()
+        # Dependents may be runnable now; don't sleep before starting them
+        self._nodes_changed = True
+        self._wake.set()
 
         self.on_status_change()
-        save_workflow(self.chain)
+        # Saved by the poll loop, at most once per SAVE_INTERVAL
+        self._save_dirty = True
 
     async def run(self):
         """Execute the workflow chain asynchronously."""
@@ -859,44 +1463,80 @@ class WorkflowOrchestrator:
         self.log.info(f"Nodes: {len(self.chain.nodes)}, Session: {self.executor.session}")
 
         # Install Claude Code hooks for all nodes before execution
-        self._install_hooks_for_nodes()
+        await self._install_hooks_for_nodes()
 
         # Clean up old windows, keep only current workflow's nodes
         current_node_ids = {node.id for node in self.chain.nodes}
         self.executor.cleanup_old_windows(keep_node_ids=current_node_ids)
 
+        # Pick up nodes left running by an earlier run
+        self._running_nodes = {node.id: node for node in self.chain.get_running_nodes()}
+        self._nodes_changed = True
+        is_complete = self.chain.is_complete
+        get_runnable = self.chain.get_runnable_nodes
+        check_completion = self._check_node_completion
+
+        # Wake on Stop-hook state writes instead of polling; without a watcher
+        # state files are only seen by polling every POLL_INTERVAL
+        self.hook_manager.ensure_state_dir()
+        watcher = StateDirWatcher.start(self.hook_manager.WORKFLOW_STATE_DIR, self._wake)
+        timeout = self.WAKE_TIMEOUT if watcher else self.POLL_INTERVAL
+        next_pane_check = 0.0
+        next_log_flush = 0.0
+        idle_ticks = 0
+
         try:
             loop_count = 0
-            while self._running and not self.chain.is_complete():
+            while self._running:
                 loop_count += 1
-                self.log.debug(f"Poll loop #{loop_count}: running={self._running}, complete={self.chain.is_complete()}")
+                # Guarded: the arguments themselves cost a call
+                if self.log.isdebug():
+                    self.log.debug("Poll loop #%d: running=%s, complete=%s",
+                                   loop_count, self._running, is_complete())
 
-                if self._paused:
-                    await asyncio.sleep(1)
+                if not self._unpaused.is_set():
+                    await self._unpaused.wait()
                     continue
 
-                # Start runnable nodes
-                runnable = self.chain.get_runnable_nodes()
-                for node in runnable:
-                    self.execute_node(node)
-
-                # Check running nodes for completion
-                for node in self.chain.get_running_nodes():
-                    if self._check_node_completion(node):
+                # Start runnable nodes concurrently; only a finished or reset
+                # node can change what is runnable or whether the chain is done
+                active = False
+                if self._nodes_changed:
+                    self._nodes_changed = False
+                    if is_complete():
+                        break
+                    runnable = get_runnable()
+                    if runnable:
+                        await asyncio.gather(*(self.execute_node(node) for node in runnable))
+                        # A start can fail the node outright
+                        self._nodes_changed = True
+                        active = True
+
+                # Check running nodes for completion (one state dir scan per tick)
+                states = self.hook_manager.scan_states()
+                check_panes = time.monotonic() >= next_pane_check
+                # Query all running panes concurrently, then handle completions in order
+                running = list(self._running_nodes.values())
+                finished = await asyncio.gather(
+                    *(check_completion(node, states, check_panes) for node in running)
+                )
+                for node, done in zip(running, finished):
+                    if done:
+                        active = True
+                        # One 200-line capture serves the error scan, the error file
+                        # and the node output
+                        full_output = await self._capture_tail(node, 200)
                         # Check output for errors - only check last 15 lines to avoid false positives
                         # from errors that Claude recovered from earlier in the session
-                        output = self.executor.capture_pane_output(node.tmux_pane, 50)
-                        last_lines = "\n".join(output.split('\n')[-15:]).lower()
-
-                        # Success indicators - Claude completed the task
-                        success_indicators = [
-                            "ready to use", "successfully", "completed", "done",
-                            "created", "updated", "fixed", "working", "finished"
-                        ]
-                        has_success = any(ind in last_lines for ind in success_indicators)
-
-                        # Only check for errors in last lines, and ignore if success was indicated
-                        has_error = "error" in last_lines and not has_success
+                        output = await self._capture_tail(node, 50)
+                        tail_start = self._tail_offset(output, 15)
+
+                        # Only check for errors in last lines, and ignore if success was indicated;
+                        # the success scan only runs for the rare output mentioning an error
+                        has_error = (
+                            self._ERROR_RE.search(output, tail_start) is not None
+                            and self._SUCCESS_RE.search(output, tail_start) is None
+                        )
                         success = not has_error
 
                         if not success:
@@ -904,15 +1544,14 @@ class WorkflowOrchestrator:
                             self.log.warning(f"[{node.id}] Error detected in output")
                             # Find lines containing 'error' to show what triggered failure
                             error_lines = [
-                                line.strip() for line in output.split('\n')
-                                if 'error' in line.lower()
-                            ][:5]  # Show first 5 error lines
+                                m.group(0).strip() for m in
+                                itertools.islice(self._ERROR_LINE_RE.finditer(output), 5)
+                            ]  # Show first 5 error lines
                             for line in error_lines:
                                 self.log.warning(f"[{node.id}] >> {line[:200]}")
                             node.error_message = error_lines[0][:200] if error_lines else "Error detected in output"
 
                             # Write full output to error file for debugging
-                            full_output = self.executor.capture_pane_output(node.tmux_pane, 200)
                             WorkflowLogger.write_error_file(
                                 self.chain.id,
                                 node.id,
@@ -923,11 +1562,26 @@ class WorkflowOrchestrator:
 
                         self.complete_node(node, success)
 
-                await asyncio.sleep(2)  # Poll interval
+                # Keep the log viewer current without a write per record
+                now = time.monotonic()
+                if now >= next_log_flush:
+                    self.log.flush()
+                    next_log_flush = now + self.LOG_FLUSH_INTERVAL
+                if self._save_dirty and now - self._last_save >= self.SAVE_INTERVAL:
+                    self._save()
+
+                # Poll quickly right after activity and back off while nothing happens
+                if active:
+                    idle_ticks = 0
+                delay = min(timeout, self.MIN_POLL_INTERVAL * 2 ** idle_ticks)
+                if delay < timeout:
+                    idle_ticks += 1
+                if check_panes:
+                    next_pane_check = time.monotonic() + delay
+                await self._sleep(delay)
 
         except Exception as e:
             # Log the exception with full traceback
-            import traceback
             tb = traceback.format_exc()
             self.log.error(f"Workflow execution failed: {e}")
             self.log.error(f"Traceback:\n{tb}")
@@ -941,15 +1595,19 @@ class WorkflowOrchestrator:
 
             # Mark running nodes as failed
             for node in self.chain.get_running_nodes():
-                node.status = NodeStatus.FAILED
+                self.chain.set_status(node, NodeStatus.FAILED)
                 node.error_message = str(e)
                 node.completed_at = datetime.now().isoformat()
-            save_workflow(self.chain)
+            self._save()
             raise
 
         finally:
             self._running = False
             set_active_workflow(None)
+            if self._save_dirty:
+                self._save()
+            if watcher:
+                watcher.close()
 
             # Clean up any remaining hooks and state files when workflow completes
             # Individual node hooks/states are cleaned up in complete_node()
@@ -960,11 +1618,30 @@ class WorkflowOrchestrator:
 
             # Record execution
             duration = (datetime.now() - start_time).total_seconds()
-            status = "completed" if self.chain.is_complete() and not self.chain.has_failed() else "failed"
+            complete = self.chain.is_complete() and not self.chain.has_failed()
+            status = "completed" if complete else "failed"
             add_execution_history(self.chain.id, status, duration)
 
             completed, total = self.chain.progress
             self.log.info(f"=== Workflow {status} === ({completed}/{total} nodes, {duration:.1f}s)")
+            self.log.flush()
+            self.executor.close()
+
+    def _save(self):
+        """Write the chain now, including any pending node starts/completions."""
+        save_workflow(self.chain)
+        self._save_dirty = False
+        self._last_save = time.monotonic()
+
+    async def _sleep(self, timeout: float) -> bool:
+        """Sleep until woken or timeout seconds pass; True if woken."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._wake.clear()
 
     def run_sync(self):
         """Run workflow synchronously (blocking)."""
@@ -973,9 +1650,12 @@ class WorkflowOrchestrator:
     def stop(self):
         """Stop workflow execution."""
         self._running = False
+        self._running_nodes.clear()
+        self._wake.set()
+        self._unpaused.set()
         # Mark running nodes as failed and clean up their hooks/state
         for node in self.chain.get_running_nodes():
-            node.status = NodeStatus.FAILED
+            self.chain.set_status(node, NodeStatus.FAILED)
             node.error_message = "Stopped by user"
             node.completed_at = datetime.now().isoformat()
             # Clean up hook and state file for this stopped node
@@ -987,47 +1667,52 @@ class WorkflowOrchestrator:
         self._cleanup_hooks()
         self.hook_manager.cleanup_all_state_files()
 
-        save_workflow(self.chain)
+        self._save()
         self.on_status_change()
 
     def pause(self):
         """Pause workflow execution."""
-        self._paused = True
+        self._unpaused.clear()
         for node in self.chain.get_running_nodes():
-            node.status = NodeStatus.PAUSED
-        save_workflow(self.chain)
+            self.chain.set_status(node, NodeStatus.PAUSED)
+        self._save()
         self.on_status_change()
 
     def resume(self):
         """Resume paused workflow."""
-        self._paused = False
+        self._unpaused.set()
+        self._nodes_changed = True
         for node in self.chain.nodes:
             if node.status == NodeStatus.PAUSED:
-                node.status = NodeStatus.RUNNING
-        save_workflow(self.chain)
+                self.chain.set_status(node, NodeStatus.RUNNING)
+        self._save()
         self.on_status_change()
 
     def skip_node(self, node_id: str):
         """Skip a pending node."""
         node = self.chain.get_node_by_id(node_id)
         if node and node.status == NodeStatus.PENDING:
-            node.status = NodeStatus.SKIPPED
+            self.chain.set_status(node, NodeStatus.SKIPPED)
             node.completed_at = datetime.now().isoformat()
-            save_workflow(self.chain)
+            self._save()
             self.on_status_change()
+            self._nodes_changed = True
+            self._wake.set()
 
     def retry_node(self, node_id: str):
         """Retry a failed node."""
         node = self.chain.get_node_by_id(node_id)
         if node and node.status in (NodeStatus.FAILED, NodeStatus.SKIPPED):
-            node.status = NodeStatus.PENDING
+            self.chain.set_status(node, NodeStatus.PENDING)
             node.output = ""
             node.error_message = ""
             node.started_at = None
             node.completed_at = None
             node.tmux_pane = None
-            save_workflow(self.chain)
+            self._save()
             self.on_status_change()
+            self._nodes_changed = True
+            self._wake.set()
 
     def cleanup_windows(self):
         """Clean up workflow windows and hooks."""
@@ -1042,7 +1727,7 @@ class WorkflowOrchestrator:
 
     @property
     def is_paused(self) -> bool:
-        return self._paused
+        return not self._unpaused.is_set()
 
 
 def get_workflow_status_line(chain: WorkflowChain) -> str:
@@ -1050,12 +1735,11 @@ def get_workflow_status_line(chain: WorkflowChain) -> str:
     if not chain:
         return ""
 
-    running = len(chain.get_running_nodes())
-    completed, total = chain.progress
+    snap = chain.snapshot()
 
-    if running > 0:
-        return f"●{completed}/{total}"
-    elif chain.is_complete():
-        return f"✓{total}"
+    if snap.running > 0:
+        return f"●{snap.completed}/{snap.total}"
+    elif snap.is_complete:
+        return f"✓{snap.total}"
     else:
-        return f"○{completed}/{total}"
+        return f"○{snap.completed}/{snap.total}"
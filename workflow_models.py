@@ -1,10 +1,12 @@
 """Data models for workflow chain system."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 from pathlib import Path
-import uuid
+import secrets
 from datetime import datetime
 
 
@@ -18,17 +20,41 @@ class NodeStatus(Enum):
     PAUSED = "paused"        # Execution paused
 
 
-@dataclass
+# Statuses a node doesn't leave without a retry or reset
+FINISHED_STATUSES = frozenset({NodeStatus.COMPLETED, NodeStatus.FAILED, NodeStatus.SKIPPED})
+
+# Stored status string -> NodeStatus, for from_dict
+_STATUS_BY_VALUE = {s.value: s for s in NodeStatus}
+
+
+def new_id() -> str:
+    """Short random id for a node or workflow."""
+    return secrets.token_hex(4)
+
+
+@lru_cache(maxsize=256)
+def _parse_timestamp(value: str) -> datetime:
+    """datetime.fromisoformat(), parsed once per timestamp string."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=256)
+def _path_name(path: str) -> str:
+    """Path(path).name, computed once per path string."""
+    return Path(path).name
+
+
+@dataclass(slots=True)
 class WorkflowNode:
     """Single node in workflow chain."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=new_id)
     project_path: str = ""              # Favorite folder path
     prompt_template: str = ""           # Prompt to execute
     context_files: list[str] = field(default_factory=list)  # Files to include
     status: NodeStatus = NodeStatus.PENDING
     output: str = ""                    # Captured output
     tmux_pane: Optional[str] = None     # tmux pane ID when running
-    depends_on: list[str] = field(default_factory=list)  # Node IDs
+    depends_on: tuple[str, ...] = ()    # Node IDs
     started_at: Optional[str] = None    # ISO timestamp
     completed_at: Optional[str] = None  # ISO timestamp
     error_message: str = ""             # Error if failed
@@ -36,16 +62,16 @@ class WorkflowNode:
     @property
     def project_name(self) -> str:
         """Get project folder name."""
-        return Path(self.project_path).name if self.project_path else ""
+        return _path_name(self.project_path) if self.project_path else ""
 
     @property
     def duration_seconds(self) -> Optional[float]:
         """Calculate duration if started."""
         if not self.started_at:
             return None
-        start = datetime.fromisoformat(self.started_at)
+        start = _parse_timestamp(self.started_at)
         if self.completed_at:
-            end = datetime.fromisoformat(self.completed_at)
+            end = _parse_timestamp(self.completed_at)
         else:
             end = datetime.now()
         return (end - start).total_seconds()
@@ -67,11 +93,11 @@ class WorkflowNode:
             "id": self.id,
             "project_path": self.project_path,
             "prompt_template": self.prompt_template,
-            "context_files": self.context_files,
+            "context_files": list(self.context_files),
             "status": self.status.value,
             "output": self.output,
             "tmux_pane": self.tmux_pane,
-            "depends_on": self.depends_on,
+            "depends_on": list(self.depends_on),
             "started_at": self.started_at,
             "completed_at": self.completed_at,
             "error_message": self.error_message,
@@ -81,39 +107,124 @@ class WorkflowNode:
     def from_dict(cls, data: dict) -> "WorkflowNode":
         """Deserialize from dictionary."""
         return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
+            id=data["id"] if "id" in data else new_id(),
             project_path=data.get("project_path", ""),
             prompt_template=data.get("prompt_template", ""),
-            context_files=data.get("context_files", []),
-            status=NodeStatus(data.get("status", "pending")),
+            context_files=list(data.get("context_files", ())),
+            status=_STATUS_BY_VALUE.get(data.get("status"), NodeStatus.PENDING),
             output=data.get("output", ""),
             tmux_pane=data.get("tmux_pane"),
-            depends_on=data.get("depends_on", []),
+            depends_on=tuple(data.get("depends_on", ())),
             started_at=data.get("started_at"),
             completed_at=data.get("completed_at"),
             error_message=data.get("error_message", ""),
         )
 
 
-@dataclass
+@dataclass(frozen=True)
+class WorkflowSnapshot:
+    """Point-in-time status counts for a workflow chain."""
+    total: int = 0
+    running: int = 0
+    completed: int = 0                  # Completed, failed or skipped
+    failed: int = 0
+
+    @property
+    def is_complete(self) -> bool:
+        return self.completed == self.total
+
+    @property
+    def has_failed(self) -> bool:
+        return self.failed > 0
+
+
+@dataclass(slots=True)
 class WorkflowChain:
     """Complete workflow chain definition."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=new_id)
     name: str = ""
     nodes: list[WorkflowNode] = field(default_factory=list)
     global_context: str = ""            # Shared context for all nodes
     propagate_output: bool = True       # Pass output to next node
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Status and dependency indexes, kept in step by set_status() and the
+    # node list methods; get_runnable_nodes() reads the ready frontier
+    _by_id: dict[str, WorkflowNode] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # node id -> index in nodes, so runnable nodes come back in chain order
+    _position: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _completed_ids: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    # node id -> nodes listing it in depends_on (once per listing)
+    _dependents: dict[str, list[WorkflowNode]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # node id -> number of its dependencies not completed
+    _unmet: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Pending nodes with no unmet dependencies
+    _ready: dict[str, WorkflowNode] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Node count per status
+    _status_counts: Counter[NodeStatus] = field(default_factory=Counter, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the status and dependency indexes from the nodes."""
+        self._by_id = {n.id: n for n in self.nodes}
+        self._position = {n.id: i for i, n in enumerate(self.nodes)}
+        self._completed_ids = {n.id for n in self.nodes if n.status == NodeStatus.COMPLETED}
+        self._dependents = {}
+        self._unmet = {}
+        self._ready = {}
+        self._status_counts = Counter(n.status for n in self.nodes)
+        for node in self.nodes:
+            self._index_node(node)
+
+    def _index_node(self, node: WorkflowNode):
+        for dep in node.depends_on:
+            self._dependents.setdefault(dep, []).append(node)
+        unmet = sum(dep not in self._completed_ids for dep in node.depends_on)
+        self._unmet[node.id] = unmet
+        if node.status == NodeStatus.PENDING and not unmet:
+            self._ready[node.id] = node
+
+    def set_status(self, node: WorkflowNode, status: NodeStatus):
+        """Change a node's status; use this rather than assigning node.status."""
+        old = node.status
+        if old == status:
+            return
+        node.status = status
+        self._status_counts[old] -= 1
+        self._status_counts[status] += 1
+        unmet, ready = self._unmet, self._ready
+        if status is NodeStatus.COMPLETED:
+            self._completed_ids.add(node.id)
+            for dependent in self._dependents.get(node.id, ()):
+                dep_id = dependent.id
+                remaining = unmet[dep_id] = unmet[dep_id] - 1
+                if not remaining and dependent.status is NodeStatus.PENDING:
+                    ready[dep_id] = dependent
+        elif old is NodeStatus.COMPLETED:
+            self._completed_ids.discard(node.id)
+            for dependent in self._dependents.get(node.id, ()):
+                unmet[dependent.id] += 1
+                ready.pop(dependent.id, None)
+        if status is NodeStatus.PENDING:
+            if not unmet.get(node.id):
+                ready[node.id] = node
+        elif old is NodeStatus.PENDING:
+            ready.pop(node.id, None)
+
+    def set_dependencies(self, node: WorkflowNode, depends_on: Iterable[str]):
+        """Replace a node's depends_on; use this rather than assigning it."""
+        node.depends_on = tuple(depends_on)
+        self._reindex()
 
     def get_runnable_nodes(self) -> list[WorkflowNode]:
-        """Get nodes ready to run (dependencies satisfied)."""
-        completed_ids = {n.id for n in self.nodes if n.status == NodeStatus.COMPLETED}
-        return [
-            n for n in self.nodes
-            if n.status == NodeStatus.PENDING
-            and all(dep in completed_ids for dep in n.depends_on)
-        ]
+        """Get nodes ready to run (dependencies satisfied), in chain order."""
+        pending = NodeStatus.PENDING
+        runnable = [n for n in self._ready.values() if n.status is pending]
+        runnable.sort(key=lambda n: self._position[n.id])
+        return runnable
 
     def get_running_nodes(self) -> list[WorkflowNode]:
         """Get currently running nodes."""
@@ -129,14 +240,11 @@ class WorkflowChain:
 
     def is_complete(self) -> bool:
         """Check if all nodes are done."""
-        return all(
-            n.status in (NodeStatus.COMPLETED, NodeStatus.FAILED, NodeStatus.SKIPPED)
-            for n in self.nodes
-        )
+        return self._finished_count() == len(self.nodes)
 
     def has_failed(self) -> bool:
         """Check if any node failed."""
-        return any(n.status == NodeStatus.FAILED for n in self.nodes)
+        return self._status_counts[NodeStatus.FAILED] > 0
 
     def reset(self):
         """Reset all nodes to pending."""
@@ -147,6 +255,7 @@ class WorkflowChain:
             node.started_at = None
             node.completed_at = None
             node.error_message = ""
+        self._reindex()
 
     def add_node(self, project_path: str, prompt: str = "",
                  context_files: list[str] = None, depends_on: list[str] = None) -> WorkflowNode:
@@ -155,38 +264,51 @@ class WorkflowChain:
             project_path=project_path,
             prompt_template=prompt,
             context_files=context_files or [],
-            depends_on=depends_on or [],
+            depends_on=tuple(depends_on or ()),
         )
+        self._position[node.id] = len(self.nodes)
         self.nodes.append(node)
-        self.updated_at = datetime.now().isoformat()
+        self._by_id[node.id] = node
+        self._status_counts[node.status] += 1
+        self._index_node(node)
         return node
 
     def remove_node(self, node_id: str):
         """Remove a node and update dependencies."""
+        # Nodes that list it, each once
+        dependents = {n.id: n for n in self._dependents.get(node_id, ())}
         self.nodes = [n for n in self.nodes if n.id != node_id]
         # Remove from dependencies
-        for node in self.nodes:
-            node.depends_on = [d for d in node.depends_on if d != node_id]
-        self.updated_at = datetime.now().isoformat()
+        for node in dependents.values():
+            node.depends_on = tuple(d for d in node.depends_on if d != node_id)
+        self._reindex()
 
     def move_node(self, node_id: str, new_index: int):
         """Move a node to a new position."""
-        node = next((n for n in self.nodes if n.id == node_id), None)
+        node = self._by_id.get(node_id)
         if node:
             self.nodes.remove(node)
             self.nodes.insert(new_index, node)
-            self.updated_at = datetime.now().isoformat()
+            self._position = {n.id: i for i, n in enumerate(self.nodes)}
 
     def get_node_by_id(self, node_id: str) -> Optional[WorkflowNode]:
         """Get node by ID."""
-        return next((n for n in self.nodes if n.id == node_id), None)
+        return self._by_id.get(node_id)
+
+    def _finished_count(self) -> int:
+        counts = self._status_counts
+        return sum(counts[status] for status in FINISHED_STATUSES)
+
+    def snapshot(self) -> WorkflowSnapshot:
+        """Running/completed/failed counts, read from the status counts."""
+        counts = self._status_counts
+        return WorkflowSnapshot(len(self.nodes), counts[NodeStatus.RUNNING],
+                                self._finished_count(), counts[NodeStatus.FAILED])
 
     @property
     def progress(self) -> tuple[int, int]:
         """Return (completed, total) node counts."""
-        completed = len([n for n in self.nodes if n.status in
-                        (NodeStatus.COMPLETED, NodeStatus.FAILED, NodeStatus.SKIPPED)])
-        return completed, len(self.nodes)
+        return self._finished_count(), len(self.nodes)
 
     @property
     def progress_percent(self) -> float:
@@ -210,13 +332,13 @@ class WorkflowChain:
     def from_dict(cls, data: dict) -> "WorkflowChain":
         """Deserialize from dictionary."""
         return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
+            id=data["id"] if "id" in data else new_id(),
             name=data.get("name", ""),
             nodes=[WorkflowNode.from_dict(n) for n in data.get("nodes", [])],
             global_context=data.get("global_context", ""),
             propagate_output=data.get("propagate_output", True),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
+            created_at=data["created_at"] if "created_at" in data else datetime.now().isoformat(),
+            updated_at=data["updated_at"] if "updated_at" in data else datetime.now().isoformat(),
         )
 
 
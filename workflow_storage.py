@@ -1,68 +1,174 @@
 """Storage and persistence for workflow chains."""
 
+import atexit
 import json
+import logging
+import os
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
-from workflow_models import WorkflowChain, WorkflowNode
+from workflow_models import WorkflowChain, WorkflowNode, new_id
+
+# Optional: orjson for faster JSON (de)serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Storage file path (same directory as script)
 SCRIPT_DIR = Path(__file__).parent
 WORKFLOWS_FILE = SCRIPT_DIR / ".tui_workflows.json"
 DEPS_FILE = SCRIPT_DIR / ".tui_dependencies.json"
+# Execution history, one JSON record per line, appended to
+HISTORY_FILE = SCRIPT_DIR / ".tui_exec_history.jsonl"
+
+# Records kept when the history file is compacted
+HISTORY_LIMIT = 50
+# Size past which an append compacts the history file (in a background thread)
+HISTORY_COMPACT_BYTES = 64 * 1024
+
+# Seconds a save waits so that saves in quick succession write the file once
+FLUSH_DELAY = 0.2
+
+# Parsed storage, reused while WORKFLOWS_FILE's (st_mtime_ns, st_size) is unchanged.
+# "dirty" means data holds saves not yet written; guarded by _lock
+_cache = {"key": None, "data": None, "dirty": False}
+_lock = threading.RLock()
+_flush_timer: Optional[threading.Timer] = None
+# Serializes appends to HISTORY_FILE with its compaction
+_history_lock = threading.Lock()
+
+log = logging.getLogger("workflow.storage")
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def json_loads(data: bytes | str):
+    """Parse JSON; decode errors are json.JSONDecodeError either way."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _file_key() -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(WORKFLOWS_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 def _load_storage() -> dict:
-    """Load storage file."""
-    if WORKFLOWS_FILE.exists():
-        try:
-            with open(WORKFLOWS_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-    return {
-        "workflows": {},
-        "active_workflow": None,
-        "execution_history": [],
-    }
+    """Load storage file (parsed once, then reused until the file changes).
+
+    The returned dict is the cached one: mutate it only to pass it to _save_storage.
+    """
+    with _lock:
+        if _cache["dirty"]:
+            return _cache["data"]
+        key = _file_key()
+        if _cache["data"] is not None and key == _cache["key"]:
+            return _cache["data"]
+        data = None
+        if key is not None:
+            try:
+                data = json_loads(WORKFLOWS_FILE.read_bytes())
+            except (json.JSONDecodeError, IOError):
+                pass
+        if data is None:
+            data = {
+                "workflows": {},
+                "active_workflow": None,
+            }
+        _cache.update(key=key, data=data)
+        return data
 
 
 def _save_storage(data: dict):
-    """Save storage file."""
-    with open(WORKFLOWS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    """Save storage file, after FLUSH_DELAY so that a burst of saves writes once."""
+    global _flush_timer
+    with _lock:
+        _cache.update(data=data, dirty=True)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_DELAY, _flush_in_background)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_storage():
+    """Write pending saves to the storage file now.
+
+    Raises OSError if the write fails; the saves stay pending.
+    """
+    global _flush_timer
+    with _lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _cache["dirty"]:
+            return
+        # Write a sibling and rename it over, so the file is never half written
+        tmp = WORKFLOWS_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(json_dumps_bytes(_cache["data"]))
+        os.replace(tmp, WORKFLOWS_FILE)
+        _cache.update(key=_file_key(), dirty=False)
+
+
+def _flush_in_background():
+    """Timer target for _save_storage: the write has no caller to raise to."""
+    try:
+        flush_storage()
+    except OSError:
+        # Still dirty, so the next save or the exit flush tries again
+        log.exception("Could not write %s", WORKFLOWS_FILE)
+
+
+atexit.register(flush_storage)
 
 
 def load_workflows() -> dict[str, WorkflowChain]:
     """Load all workflows."""
-    data = _load_storage()
-    workflows = {}
-    for wf_id, wf_data in data.get("workflows", {}).items():
-        workflows[wf_id] = WorkflowChain.from_dict(wf_data)
-    return workflows
+    with _lock:
+        data = _load_storage()
+        return {
+            wf_id: WorkflowChain.from_dict(wf_data)
+            for wf_id, wf_data in data.get("workflows", {}).items()
+        }
 
 
 def save_workflow(workflow: WorkflowChain):
     """Save a single workflow."""
-    data = _load_storage()
-    workflow.updated_at = datetime.now().isoformat()
-    data["workflows"][workflow.id] = workflow.to_dict()
-    _save_storage(data)
+    with _lock:
+        data = _load_storage()
+        # Stamped here once, not by each node edit
+        workflow.updated_at = datetime.now().isoformat()
+        data["workflows"][workflow.id] = workflow.to_dict()
+        _save_storage(data)
 
 
 def delete_workflow(workflow_id: str):
     """Delete a workflow."""
-    data = _load_storage()
-    if workflow_id in data.get("workflows", {}):
-        del data["workflows"][workflow_id]
-        _save_storage(data)
+    with _lock:
+        data = _load_storage()
+        if workflow_id in data.get("workflows", {}):
+            del data["workflows"][workflow_id]
+            _save_storage(data)
 
 
 def get_workflow(workflow_id: str) -> Optional[WorkflowChain]:
     """Get a specific workflow."""
-    workflows = load_workflows()
-    return workflows.get(workflow_id)
+    with _lock:
+        wf_data = _load_storage().get("workflows", {}).get(workflow_id)
+        return WorkflowChain.from_dict(wf_data) if wf_data else None
 
 
 def get_active_workflow_id() -> Optional[str]:
@@ -73,51 +179,94 @@ def get_active_workflow_id() -> Optional[str]:
 
 def set_active_workflow(workflow_id: Optional[str]):
     """Set the active workflow."""
-    data = _load_storage()
-    data["active_workflow"] = workflow_id
-    _save_storage(data)
+    with _lock:
+        data = _load_storage()
+        data["active_workflow"] = workflow_id
+        _save_storage(data)
+
+
+def _read_history(limit: int) -> list[dict]:
+    """Last limit records of HISTORY_FILE, oldest first."""
+    try:
+        with open(HISTORY_FILE, encoding="utf-8") as f:
+            lines = deque(f, maxlen=limit)
+    except OSError:
+        return []
+    records = []
+    for line in lines:
+        try:
+            records.append(json_loads(line))
+        except json.JSONDecodeError:
+            continue  # Partly written line
+    return records
+
+
+def _compact_history():
+    """Rewrite HISTORY_FILE with only its last HISTORY_LIMIT records."""
+    with _history_lock:
+        records = _read_history(HISTORY_LIMIT)
+        tmp = HISTORY_FILE.with_suffix(".jsonl.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+        os.replace(tmp, HISTORY_FILE)
+
+
+def _migrate_history():
+    """Move history kept in the storage file by older versions to HISTORY_FILE."""
+    with _lock:
+        data = _load_storage()
+        records = data.pop("execution_history", None)
+        if records is None:
+            return
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+        _save_storage(data)
 
 
 def add_execution_history(workflow_id: str, status: str, duration: float = 0):
     """Add execution record to history."""
-    data = _load_storage()
-    if "execution_history" not in data:
-        data["execution_history"] = []
-
-    data["execution_history"].append({
+    record = {
         "workflow_id": workflow_id,
         "status": status,
         "duration": duration,
         "timestamp": datetime.now().isoformat(),
-    })
-
-    # Keep last 50 entries
-    data["execution_history"] = data["execution_history"][-50:]
-    _save_storage(data)
+    }
+    with _history_lock:
+        if not HISTORY_FILE.exists():
+            _migrate_history()
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            size = f.tell()
+    if size > HISTORY_COMPACT_BYTES:
+        threading.Thread(target=_compact_history, daemon=True).start()
 
 
 def get_execution_history(limit: int = 20) -> list[dict]:
     """Get recent execution history."""
-    data = _load_storage()
-    history = data.get("execution_history", [])
-    return list(reversed(history[-limit:]))
+    if not HISTORY_FILE.exists():
+        history = _load_storage().get("execution_history", [])[-limit:]
+    else:
+        history = _read_history(limit)
+    return list(reversed(history))
 
 
-def migrate_from_dependencies():
-    """Migrate existing dependency chains to workflow format."""
+def migrate_from_dependencies(progress=None):
+    """Migrate existing dependency chains to workflow format.
+
+    If given, progress(current, total, name) is called before each chain.
+    """
     if not DEPS_FILE.exists():
         return
 
     try:
-        with open(DEPS_FILE) as f:
-            deps_data = json.load(f)
+        deps_data = json_loads(DEPS_FILE.read_bytes())
     except (json.JSONDecodeError, IOError):
         return
 
-    data = _load_storage()
-    migrated = 0
+    migrated = {}  # workflow id -> serialized workflow
+    total = len(deps_data)
 
-    for project_path, dep_info in deps_data.items():
+    for current, (project_path, dep_info) in enumerate(deps_data.items(), 1):
         # Skip if not a dependency definition
         if not isinstance(dep_info, (dict, list)):
             continue
@@ -135,28 +284,35 @@ def migrate_from_dependencies():
 
         # Create workflow from dependency chain
         project_name = Path(project_path).name
-        workflow = WorkflowChain(
-            name=f"{project_name} Chain",
-            global_context=instructions,
-        )
+        if progress:
+            progress(current, total, project_name)
 
-        # Add each dependency as a node
+        # Each dependency becomes a node depending on the one before it
+        nodes = []
         prev_node_id = None
         for dep_path in chain:
-            node = workflow.add_node(
+            node = WorkflowNode(
                 project_path=dep_path,
-                depends_on=[prev_node_id] if prev_node_id else [],
+                depends_on=(prev_node_id,) if prev_node_id else (),
             )
+            nodes.append(node)
             prev_node_id = node.id
 
-        # Store with project path as key for reference
-        data["workflows"][workflow.id] = workflow.to_dict()
-        migrated += 1
+        workflow = WorkflowChain(
+            name=f"{project_name} Chain",
+            nodes=nodes,
+            global_context=instructions,
+        )
+        migrated[workflow.id] = workflow.to_dict()
 
-    if migrated > 0:
-        _save_storage(data)
+    # Storage is only read and written when there is something to add
+    if migrated:
+        with _lock:
+            data = _load_storage()
+            data["workflows"].update(migrated)
+            _save_storage(data)
 
-    return migrated
+    return len(migrated)
 
 
 def export_workflow(workflow_id: str, export_path: Path) -> bool:
@@ -165,8 +321,7 @@ def export_workflow(workflow_id: str, export_path: Path) -> bool:
     if not workflow:
         return False
 
-    with open(export_path, "w") as f:
-        json.dump(workflow.to_dict(), f, indent=2)
+    Path(export_path).write_bytes(json_dumps_bytes(workflow.to_dict()))
     return True
 
 
@@ -176,11 +331,10 @@ def import_workflow(import_path: Path) -> Optional[WorkflowChain]:
         return None
 
     try:
-        with open(import_path) as f:
-            data = json.load(f)
+        data = json_loads(import_path.read_bytes())
         workflow = WorkflowChain.from_dict(data)
         # Generate new ID to avoid conflicts
-        workflow.id = str(__import__("uuid").uuid4())[:8]
+        workflow.id = new_id()
         save_workflow(workflow)
         return workflow
     except (json.JSONDecodeError, IOError):
@@ -205,28 +359,26 @@ def duplicate_workflow(workflow_id: str, new_name: str = None) -> Optional[Workf
     if not original:
         return None
 
-    # Create new workflow with copied data
+    # Copy nodes with new IDs, dependencies already pointing at the copies
+    id_mapping = {old_node.id: new_id() for old_node in original.nodes}
+    nodes = [
+        WorkflowNode(
+            id=id_mapping[old_node.id],
+            project_path=old_node.project_path,
+            prompt_template=old_node.prompt_template,
+            context_files=old_node.context_files.copy(),
+            depends_on=tuple(id_mapping.get(dep, dep) for dep in old_node.depends_on),
+        )
+        for old_node in original.nodes
+    ]
+
+    # Create new workflow with copied data; its indexes are built once here
     new_workflow = WorkflowChain(
         name=new_name or f"{original.name} (copy)",
+        nodes=nodes,
         global_context=original.global_context,
         propagate_output=original.propagate_output,
     )
 
-    # Copy nodes with new IDs
-    id_mapping = {}  # old_id -> new_id
-    for old_node in original.nodes:
-        new_node = new_workflow.add_node(
-            project_path=old_node.project_path,
-            prompt=old_node.prompt_template,
-            context_files=old_node.context_files.copy(),
-        )
-        id_mapping[old_node.id] = new_node.id
-
-    # Update dependencies with new IDs
-    for i, old_node in enumerate(original.nodes):
-        new_workflow.nodes[i].depends_on = [
-            id_mapping.get(dep, dep) for dep in old_node.depends_on
-        ]
-
     save_workflow(new_workflow)
     return new_workflow